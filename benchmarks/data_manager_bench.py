@@ -0,0 +1,193 @@
+"""Headless DataManager benchmarks over synthetic multi-year histories.
+
+Usage:
+    python -m benchmarks.data_manager_bench --years 1 5 20 --blocks 5 50 \
+        --backends json sqlite --output results.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.synthetic import generate_days, write_history
+from src.data_manager import DataManager
+
+END_DATE = date(2026, 1, 1)
+
+# Where each backend keeps its data inside the benchmark's temp directory
+BACKEND_LOCATIONS = {
+    "json": "{dir}/tasks.json",
+    "journal": "journal://{dir}/tasks.json",
+    "sqlite": "{dir}/tasks.db",
+    "shards": "shards://{dir}/data",
+}
+
+
+def read_io_counters() -> Optional[Dict[str, int]]:
+    """Bytes read/written by this process so far (Linux only)"""
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(": ") for line in f.read().splitlines())
+    except OSError:
+        return None
+    return {"read": int(fields["rchar"]), "written": int(fields["wchar"])}
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(
+    operation: Callable[[int], Any], iterations: int, memory_iterations=3
+) -> Dict[str, Any]:
+    """Time an operation and record its I/O and peak traced memory"""
+    io_before = read_io_counters()
+    timings = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        operation(i)
+        timings.append((time.perf_counter() - start) * 1000)
+    io_after = read_io_counters()
+
+    # Memory is traced in a separate pass so tracing does not skew timings
+    tracemalloc.start()
+    for i in range(memory_iterations):
+        operation(iterations + i)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    result = {
+        "iterations": iterations,
+        "p50_ms": percentile(timings, 0.5),
+        "p99_ms": percentile(timings, 0.99),
+        "mean_ms": sum(timings) / len(timings),
+        "peak_memory_bytes": peak_memory,
+        "bytes_read": None,
+        "bytes_written": None,
+    }
+    if io_before and io_after:
+        result["bytes_read"] = (io_after["read"] - io_before["read"]) // iterations
+        result["bytes_written"] = (
+            io_after["written"] - io_before["written"]
+        ) // iterations
+    return result
+
+
+def bench_history(
+    backend: str, years: int, blocks_per_day: int, iterations: int, seed: int
+) -> List[Dict[str, Any]]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix="tt-bench-") as directory:
+        location = BACKEND_LOCATIONS[backend].format(dir=directory)
+        # The journal starts from a plain JSON snapshot, like a migrated file
+        seed_location = location.replace("journal://", "json://")
+        days = write_history(
+            seed_location, years, blocks_per_day, end_date=END_DATE, seed=seed
+        )
+
+        rng = random.Random(seed)
+        dates = [
+            END_DATE - timedelta(days=rng.randint(1, days))
+            for _ in range(iterations + 10)
+        ]
+        new_blocks = next(generate_days(1, blocks_per_day, seed=seed + 1))[1]
+
+        def cold_load(i):
+            manager = DataManager(location, write_delay=0)
+            manager.load_time_blocks(dates[i])
+            manager.close()
+
+        manager = DataManager(location, write_delay=0)
+        manager.load_time_blocks(dates[0])  # Warm the document cache
+        manager.rebuild_rollups()  # Build the stats sidecar before timing saves
+        operations = {
+            "cold_load_time_blocks": cold_load,
+            "load_time_blocks": lambda i: manager.load_time_blocks(dates[i]),
+            "load_top_tasks": lambda i: manager.load_top_tasks(dates[i]),
+            "save_time_blocks": lambda i: manager.save_time_blocks(
+                dates[i], new_blocks["tasks"]
+            ),
+            "save_top_tasks": lambda i: manager.save_top_tasks(
+                dates[i], new_blocks["top_tasks"]
+            ),
+        }
+        try:
+            for name, operation in operations.items():
+                result = measure(operation, iterations)
+                result.update(
+                    {
+                        "backend": backend,
+                        "operation": name,
+                        "years": years,
+                        "blocks_per_day": blocks_per_day,
+                        "days": days,
+                    }
+                )
+                results.append(result)
+                print_result(result)
+        finally:
+            manager.close()
+    return results
+
+
+def print_result(result: Dict[str, Any]):
+    print(
+        f"{result['backend']:8} {result['years']:>3}y {result['blocks_per_day']:>3}b "
+        f"{result['operation']:24} p50 {result['p50_ms']:9.3f} ms  "
+        f"p99 {result['p99_ms']:9.3f} ms  "
+        f"read {result['bytes_read'] or 0:>11,} B  "
+        f"written {result['bytes_written'] or 0:>11,} B  "
+        f"peak {result['peak_memory_bytes']:>12,} B",
+        flush=True,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--blocks", type=int, nargs="+", default=[5, 50])
+    parser.add_argument(
+        "--backends", nargs="+", default=["json"], choices=sorted(BACKEND_LOCATIONS)
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    results = []
+    for backend in args.backends:
+        for years in args.years:
+            for blocks_per_day in args.blocks:
+                results.extend(
+                    bench_history(
+                        backend, years, blocks_per_day, args.iterations, args.seed
+                    )
+                )
+
+    if args.output:
+        report = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "arguments": vars(args),
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import random
+from datetime import date, timedelta
+from typing import Iterator, Optional, Tuple
+
+from src.storage.base import DayRecord
+from src.storage.factory import open_storage
+
+TASK_NAMES = [
+    "Deep work",
+    "Email",
+    "Team standup",
+    "Code review",
+    "Lunch",
+    "Planning",
+    "Exercise",
+    "Reading",
+    "1:1 meeting",
+    "Writing documentation for the quarterly roadmap",
+]
+
+
+def generate_days(
+    years: int,
+    blocks_per_day: int,
+    end_date: Optional[date] = None,
+    seed: int = 0,
+) -> Iterator[Tuple[str, DayRecord]]:
+    """Yield (date, record) pairs for a synthetic history ending at end_date"""
+    rng = random.Random(seed)
+    end_date = end_date or date(2026, 1, 1)
+    start_date = end_date - timedelta(days=365 * years)
+    # Blocks are placed on distinct quarter-hour slots so they never overlap
+    blocks_per_day = min(blocks_per_day, 96)
+
+    day = start_date
+    while day < end_date:
+        starts = sorted(rng.sample(range(96), blocks_per_day))
+        tasks = []
+        for index, start in enumerate(starts):
+            next_start = starts[index + 1] if index + 1 < len(starts) else 96
+            end = rng.randint(start + 1, next_start)
+            tasks.append(
+                {
+                    "name": rng.choice(TASK_NAMES),
+                    "start_time": start / 4,
+                    "end_time": end / 4,
+                }
+            )
+        top_tasks = [
+            {"text": rng.choice(TASK_NAMES), "completed": rng.random() < 0.6}
+            for _ in range(3)
+        ]
+        yield day.strftime("%Y-%m-%d"), {"top_tasks": top_tasks, "tasks": tasks}
+        day += timedelta(days=1)
+
+
+def write_history(location: str, years: int, blocks_per_day: int, **options) -> int:
+    """Fill a storage location with a synthetic history, returns the day count"""
+    days = list(generate_days(years, blocks_per_day, **options))
+    storage = open_storage(location)
+    try:
+        storage.save_days(iter(days))
+    finally:
+        storage.close()
+    return len(days)
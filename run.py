@@ -1,5 +1,6 @@
-from src.time_tracker import TimeManagementApp
+import sys
+
+from src.cli import main
 
 if __name__ == "__main__":
-    app = TimeManagementApp()
-    app.run()
+    sys.exit(main())
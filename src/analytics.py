@@ -0,0 +1,205 @@
+"""Time-usage reports over the whole history, computed with NumPy.
+
+NumPy is an optional dependency; install it with ``pip install numpy`` to
+use this module or the ``python -m src report`` command.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+from src.models.columnar import HistoryColumns
+from src.models.data_classes import PLACEHOLDER_TEXTS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PERIODS = ("week", "month", "year")
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# Ordinal of 1970-01-01, the epoch of numpy datetime64 days
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("Reports need NumPy, install it with: pip install numpy")
+
+
+@dataclass
+class HistoryArrays:
+    """One entry per time block, plus per top task entries"""
+
+    names: List[str]
+    day: "np.ndarray"  # datetime64[D] of each block
+    start: "np.ndarray"  # Minutes after midnight
+    end: "np.ndarray"
+    name_id: "np.ndarray"  # Index into names
+    top_day: "np.ndarray"  # datetime64[D] of each top task
+    top_completed: "np.ndarray"  # bool
+    top_set: "np.ndarray"  # bool, False for unset placeholder slots
+
+    @classmethod
+    def from_columns(cls, columns: HistoryColumns) -> "HistoryArrays":
+        require_numpy()
+        ordinals = np.frombuffer(columns.day_ordinals, dtype=np.uint32)
+        days = (ordinals.astype(np.int64) - EPOCH_ORDINAL).astype("datetime64[D]")
+        block_counts = np.diff(np.frombuffer(columns.block_offsets, dtype=np.uint32))
+        top_counts = np.diff(np.frombuffer(columns.top_offsets, dtype=np.uint32))
+
+        top_text_ids = np.frombuffer(columns.top_text_ids, dtype=np.uint32)
+        placeholder_ids = [
+            name_id
+            for name_id, name in enumerate(columns.names)
+            if name in PLACEHOLDER_TEXTS
+        ]
+        return cls(
+            names=list(columns.names),
+            day=np.repeat(days, block_counts),
+            start=np.frombuffer(columns.starts, dtype=np.uint16).astype(np.int32),
+            end=np.frombuffer(columns.ends, dtype=np.uint16).astype(np.int32),
+            name_id=np.frombuffer(columns.name_ids, dtype=np.uint32).astype(np.intp),
+            top_day=np.repeat(days, top_counts),
+            top_completed=np.frombuffer(columns.top_completed, dtype=np.uint8) > 0,
+            top_set=~np.isin(top_text_ids, placeholder_ids),
+        )
+
+    @property
+    def hours(self) -> "np.ndarray":
+        return (self.end - self.start) / 60
+
+
+@dataclass
+class Table:
+    """A labelled matrix of hours, rows by period and columns by name"""
+
+    rows: List[str]
+    columns: List[str]
+    values: "np.ndarray"
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {
+            row: {
+                column: round(float(value), 2)
+                for column, value in zip(self.columns, values)
+                if value
+            }
+            for row, values in zip(self.rows, self.values)
+        }
+
+
+def load_arrays(data_manager) -> HistoryArrays:
+    return HistoryArrays.from_columns(data_manager.load_history())
+
+
+def period_starts(days: "np.ndarray", period: str) -> "np.ndarray":
+    """First day of the week (Monday), month or year containing each day"""
+    if period == "week":
+        # 1970-01-01 was a Thursday, so (days + 3) % 7 is 0 on Mondays
+        offset = (days.astype(np.int64) + 3) % 7
+        return days - offset.astype("timedelta64[D]")
+    if period == "month":
+        return days.astype("datetime64[M]").astype("datetime64[D]")
+    if period == "year":
+        return days.astype("datetime64[Y]").astype("datetime64[D]")
+    raise ValueError(f"Unknown period {period!r}, expected one of {PERIODS}")
+
+
+def period_label(start: "np.datetime64", period: str) -> str:
+    day = start.astype(date)
+    if period == "week":
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02}"
+    if period == "month":
+        return f"{day.year}-{day.month:02}"
+    return str(day.year)
+
+
+def hours_by_name(arrays: HistoryArrays, period="week") -> Table:
+    """Hours spent on each task name per week, month or year"""
+    require_numpy()
+    starts, period_index = np.unique(
+        period_starts(arrays.day, period), return_inverse=True
+    )
+    used, name_index = np.unique(arrays.name_id, return_inverse=True)
+    cells = period_index * len(used) + name_index
+    values = np.bincount(
+        cells, weights=arrays.hours, minlength=len(starts) * len(used)
+    ).reshape(len(starts), len(used))
+    return Table(
+        rows=[period_label(start, period) for start in starts],
+        columns=[arrays.names[name_id] for name_id in used],
+        values=values,
+    )
+
+
+def hour_heatmap(arrays: HistoryArrays) -> Table:
+    """Hours booked in each hour of the day, by weekday"""
+    require_numpy()
+    hour_starts = np.arange(24, dtype=np.int32) * 60
+    # Minutes of each block falling into each hour, one row per block
+    overlap = np.clip(
+        np.minimum(arrays.end[:, None], hour_starts + 60)
+        - np.maximum(arrays.start[:, None], hour_starts),
+        0,
+        None,
+    )
+    weekday = (arrays.day.astype(np.int64) + 3) % 7
+    values = np.stack([overlap[weekday == d].sum(axis=0) for d in range(7)]) / 60
+    return Table(rows=WEEKDAYS, columns=[f"{h:02}" for h in range(24)], values=values)
+
+
+def completion(arrays: HistoryArrays, today: Optional[date] = None) -> Dict:
+    """Top task completion rate and streaks of days with all of them done.
+
+    Only priorities that were actually set count. The current streak still
+    counts if today is not finished yet.
+    """
+    require_numpy()
+    today = today or date.today()
+    day = arrays.top_day[arrays.top_set]
+    completed = arrays.top_completed[arrays.top_set]
+    result = {
+        "tasks_set": int(len(day)),
+        "tasks_completed": int(completed.sum()),
+        "completion_rate": float(completed.mean()) if len(day) else 0.0,
+        "days_all_done": 0,
+        "longest_streak": 0,
+        "current_streak": 0,
+    }
+    if not len(day):
+        return result
+
+    days, inverse = np.unique(day, return_inverse=True)
+    all_done = np.bincount(inverse, weights=completed) == np.bincount(inverse)
+    result["days_all_done"] = int(all_done.sum())
+
+    # Lay the days on a dense calendar so runs of True are streaks
+    first = days[0]
+    last = max(days[-1], np.datetime64(today, "D"))
+    dense = np.zeros((last - first).astype(int) + 1, dtype=np.int8)
+    dense[(days - first).astype(int)[all_done]] = 1
+    edges = np.diff(np.concatenate(([0], dense, [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    if len(run_starts):
+        result["longest_streak"] = int((run_ends - run_starts).max())
+        # A streak is current if it reaches today or yesterday
+        today_index = (np.datetime64(today, "D") - first).astype(int)
+        if run_ends[-1] >= today_index:
+            result["current_streak"] = int(run_ends[-1] - run_starts[-1])
+    return result
+
+
+def report(data_manager, period="week", last: Optional[int] = None) -> Dict:
+    """All reports as plain data, for printing or JSON output"""
+    arrays = load_arrays(data_manager)
+    hours = hours_by_name(arrays, period)
+    if last:
+        hours = Table(hours.rows[-last:], hours.columns, hours.values[-last:])
+    return {
+        "hours": hours.to_dict(),
+        "heatmap": hour_heatmap(arrays).to_dict(),
+        "completion": completion(arrays),
+    }
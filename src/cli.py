@@ -0,0 +1,149 @@
+import argparse
+import json
+import sys
+
+from src.analytics import PERIODS
+from src.data_manager import DataManager
+from src.storage.migrate import migrate
+from src.utils.profiling import profiler
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src", description="Time Tracker desktop app and tools"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time hot paths and run cProfile; Ctrl+Shift+P dumps the results",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default="time_tracker.pstats",
+        help="File the cProfile stats are written to",
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    migrate_parser = commands.add_parser(
+        "migrate", help="Copy all data from one storage location to another"
+    )
+    migrate_parser.add_argument(
+        "source", help="Location to read, e.g. tasks.json or sqlite://tasks.db"
+    )
+    migrate_parser.add_argument(
+        "destination", help="Location to write, e.g. tasks.db or shards://data"
+    )
+
+    rebuild_parser = commands.add_parser(
+        "rebuild", help="Recompute the stats rollups and search index from storage"
+    )
+    rebuild_parser.add_argument(
+        "--location", help="Storage location to read, defaults to the app's"
+    )
+
+    cleanup_parser = commands.add_parser(
+        "cleanup", help="Remove priority placeholders saved by older versions"
+    )
+    cleanup_parser.add_argument(
+        "--location", help="Storage location to clean, defaults to the app's"
+    )
+
+    report_parser = commands.add_parser(
+        "report", help="Hours per task, hour-of-day heatmap and completion stats"
+    )
+    report_parser.add_argument(
+        "--location", help="Storage location to read, defaults to the app's"
+    )
+    report_parser.add_argument(
+        "--period", choices=PERIODS, default="week", help="Grouping of hours"
+    )
+    report_parser.add_argument(
+        "--last", type=int, default=8, help="Number of recent periods to show"
+    )
+    report_parser.add_argument(
+        "--json", action="store_true", help="Print the report as JSON"
+    )
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        profiler.enable(args.profile_output)
+
+    if args.command == "migrate":
+        count = migrate(args.source, args.destination)
+        print(f"Copied {count} days from {args.source} to {args.destination}")
+        return 0
+
+    if args.command == "rebuild":
+        data_manager = DataManager(args.location, write_delay=0)
+        try:
+            days = data_manager.rebuild_rollups()
+            data_manager.search_index.rebuild()
+        finally:
+            data_manager.close()
+        print(f"Rebuilt stats rollups and search index from {days} days")
+        return 0
+
+    if args.command == "cleanup":
+        data_manager = DataManager(args.location, write_delay=0)
+        try:
+            days = data_manager.remove_placeholder_days()
+        finally:
+            data_manager.close()
+        print(f"Removed placeholder priorities from {days} days")
+        return 0
+
+    if args.command == "report":
+        return print_report(args)
+
+    # No command: start the desktop app
+    from src.time_tracker import TimeManagementApp
+
+    app = TimeManagementApp()
+    app.run()
+    return 0
+
+
+def print_report(args) -> int:
+    from src.analytics import report
+
+    data_manager = DataManager(args.location, write_delay=0)
+    try:
+        result = report(data_manager, args.period, args.last)
+    except ImportError as error:
+        print(error, file=sys.stderr)
+        return 1
+    except ValueError as error:
+        # Records the history cannot be built from, e.g. a hand-edited time
+        print(f"Cannot read {data_manager.filename}: {error}", file=sys.stderr)
+        return 1
+    finally:
+        data_manager.close()
+
+    if args.json:
+        print(json.dumps(result, indent=4))
+        return 0
+
+    print(f"Hours per {args.period}")
+    for period, hours in result["hours"].items():
+        print(f"  {period}")
+        for name, value in sorted(hours.items(), key=lambda item: -item[1]):
+            print(f"    {value:7.2f}  {name}")
+
+    print("Hours booked by weekday and hour")
+    print("       " + " ".join(f"{hour:>4}" for hour in range(24)))
+    for weekday, hours in result["heatmap"].items():
+        cells = " ".join(f"{hours.get(f'{h:02}', 0):4.0f}" for h in range(24))
+        print(f"  {weekday}  {cells}")
+
+    stats = result["completion"]
+    print(
+        f"Priorities completed: {stats['tasks_completed']}/{stats['tasks_set']} "
+        f"({stats['completion_rate']:.0%}), days with all done: "
+        f"{stats['days_all_done']}, longest streak: {stats['longest_streak']}, "
+        f"current streak: {stats['current_streak']}"
+    )
+    return 0
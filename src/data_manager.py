@@ -1,43 +1,205 @@
-import json
-import os
-from typing import Any, Dict
+import atexit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.models.columnar import HistoryColumns
+from src.models.data_classes import UIConfig, is_placeholder_section
+from src.storage.base import StorageBackend
+from src.storage.factory import open_storage, sidecar_path
+from src.storage.journal import JournalStorage
+from src.storage.rollups import RollupStore
+from src.storage.search_index import SearchIndex
+from src.storage.sidecar import SECTIONS, SignatureTracker
+from src.storage.write_behind import SectionData, WriteBehindQueue, write_sections
+from src.utils.profiling import profiled
 
 
 class DataManager:
-    def __init__(self, filename="tasks.json"):
-        self.filename = filename
+    def __init__(
+        self,
+        filename=None,
+        storage: Optional[StorageBackend] = None,
+        journal=False,
+        compact_threshold=1024 * 1024,
+        write_delay=None,
+    ):
+        config = UIConfig()
+        self.filename = filename or config.SAVE_FILE
+        # Derived files are only kept for locations we opened ourselves
+        owns_location = storage is None
+
+        # The backend is picked from the location's scheme or extension unless
+        # one is passed in explicitly
+        if storage is None:
+            storage = (
+                JournalStorage(self.filename, compact_threshold)
+                if journal
+                else open_storage(self.filename, compact_threshold)
+            )
+        self.storage = storage
+        # Tells the indexes which storage changes were our own
+        self.signatures = SignatureTracker(self.storage.data_signature)
+
+        # Saves are coalesced and written by a background thread unless the
+        # delay is 0, in which case they are written synchronously
+        if write_delay is None:
+            write_delay = config.SAVE_DELAY
+        self.write_queue: Optional[WriteBehindQueue] = None
+        if write_delay > 0:
+            self.write_queue = WriteBehindQueue(
+                self.storage, write_delay, self.signatures.write
+            )
+            atexit.register(self.close)
+
+        self._save_listeners: List[Callable[[str, str, list], None]] = []
+
+        # Totals for the stats views and the search index, updated on every save
+        self.rollups = RollupStore(
+            sidecar_path(self.filename, ".rollups.json") if owns_location else None,
+            self._iter_stored_days,
+            self.signatures,
+        )
+        self.search_index = SearchIndex(
+            sidecar_path(self.filename, ".search.json") if owns_location else None,
+            self._iter_stored_days,
+            self._load_day,
+            self.signatures,
+        )
+        self._indexes = [self.rollups, self.search_index]
 
     def load_top_tasks(self, date):
-        data = self._load_data()
-        date_str = date.strftime("%Y-%m-%d")
-        return data.get(date_str, {}).get("top_tasks", [])
+        return self._load_section(date, "top_tasks")
 
     def save_top_tasks(self, date, tasks):
         self._save_section(date, "top_tasks", tasks)
 
     def load_time_blocks(self, date):
-        data = self._load_data()
-        date_str = date.strftime("%Y-%m-%d")
-        return data.get(date_str, {}).get("tasks", [])
+        return self._load_section(date, "tasks")
 
     def save_time_blocks(self, date, blocks):
         self._save_section(date, "tasks", blocks)
 
-    def _load_data(self) -> Dict[str, Any]:
-        try:
-            with open(self.filename, "r") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {}
+    def delete_top_tasks(self, date):
+        """Remove a day's priorities, and the day once nothing else is stored"""
+        self._commit({(date.strftime("%Y-%m-%d"), "top_tasks"): None})
+
+    @profiled("data_manager.load")
+    def load_day(self, date) -> Dict[str, list]:
+        """Load both sections of a day with a single storage read"""
+        return self._load_day(date.strftime("%Y-%m-%d"))
+
+    def load_history(self) -> HistoryColumns:
+        """Load every stored day into a compact column store"""
+        return HistoryColumns.from_days(self._iter_stored_days())
+
+    def add_save_listener(self, listener: Callable[[str, str, list], None]):
+        """Call listener(date_str, section_name, data) after every save"""
+        self._save_listeners.append(listener)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return storage read cache hit/miss counters"""
+        return self.storage.cache_stats()
+
+    def rebuild_rollups(self) -> int:
+        """Recompute the stats rollups from storage, returning the day count"""
+        return self.rollups.rebuild()
+
+    def load_indexes(self):
+        """Load or rebuild the derived indexes ahead of their first use"""
+        for index in self._indexes:
+            index.load()
+
+    def search(self, query: str):
+        """Number of days matching every query term, and (date_str, matching
+        texts) of the newest ones"""
+        return self.search_index.search(query)
 
+    def remove_placeholder_days(self) -> int:
+        """Delete stored priorities that are only placeholders, returning the count
+
+        Days left without any section are removed from storage altogether.
+        """
+        keys = [
+            (date_str, "top_tasks")
+            for date_str, record in self._iter_stored_days()
+            if "top_tasks" in record and is_placeholder_section(record["top_tasks"])
+        ]
+        self._commit(dict.fromkeys(keys))
+        return len(keys)
+
+    def flush(self):
+        """Write all pending saves to storage immediately"""
+        if self.write_queue is not None:
+            self.write_queue.flush()
+        for index in self._indexes:
+            index.save()
+
+    def close(self):
+        """Flush pending saves and release storage resources"""
+        if self.write_queue is not None:
+            self.write_queue.close()
+            atexit.unregister(self.close)
+        for index in self._indexes:
+            index.save()
+        self.storage.close()
+
+    def _load_day(self, date_str: str) -> Dict[str, list]:
+        record = self.storage.load_day(date_str)
+        day = {}
+        for section_name in SECTIONS:
+            data = self._pending_section(date_str, section_name)
+            if data is None:
+                data = record.get(section_name, [])
+            day[section_name] = self._copy_section(data)
+        return day
+
+    @profiled("data_manager.load")
+    def _load_section(self, date, section_name):
+        date_str = date.strftime("%Y-%m-%d")
+        pending = self._pending_section(date_str, section_name)
+        if pending is not None:
+            return self._copy_section(pending)
+
+        record = self.storage.load_day(date_str)
+        return self._copy_section(record.get(section_name, []))
+
+    @profiled("data_manager.save")
     def _save_section(self, date, section_name, data):
-        all_data = self._load_data()
         date_str = date.strftime("%Y-%m-%d")
-        if date_str not in all_data:
-            all_data[date_str] = {}
-        all_data[date_str][section_name] = data
-
-        temp_file = f"{self.filename}.tmp"
-        with open(temp_file, "w") as f:
-            json.dump(all_data, f, indent=4)
-        os.replace(temp_file, self.filename)
+        self._commit({(date_str, section_name): self._copy_section(data)})
+
+    def _commit(self, sections: Dict[Tuple[str, str], SectionData]):
+        """Write sections, deleting those given as None, then tell indexes and
+        listeners"""
+        if not sections:
+            return
+        # Loaded before writing, so the write is not mistaken for an outside one
+        self.load_indexes()
+        if self.write_queue is not None:
+            self.write_queue.put_many(sections)
+        else:
+            self.signatures.write(lambda: write_sections(self.storage, sections))
+
+        for (date_str, section_name), data in sections.items():
+            if data is None:
+                data = []
+            for index in self._indexes:
+                index.update(date_str, section_name, data)
+            for listener in self._save_listeners:
+                listener(date_str, section_name, data)
+
+    def _pending_section(self, date_str, section_name) -> Optional[list]:
+        """Saved data that has not reached storage yet, or None"""
+        if self.write_queue is not None:
+            return self.write_queue.get(date_str, section_name)
+        return None
+
+    def _iter_stored_days(self):
+        """All stored days, including saves still waiting to be written"""
+        if self.write_queue is not None:
+            self.write_queue.flush()
+        return self.storage.iter_days()
+
+    @staticmethod
+    def _copy_section(items):
+        """Copy section records so callers cannot mutate cached documents"""
+        return [dict(item) for item in items]
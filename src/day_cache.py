@@ -0,0 +1,141 @@
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Dict, List
+
+from src.data_manager import DataManager
+from src.models.data_classes import DayModel, Dimensions, Task, TopTask
+
+logger = logging.getLogger(__name__)
+
+
+class DayModelCache:
+    """LRU cache of DayModels with background prefetching of nearby days.
+
+    After each navigation ``prefetch_around`` queues the surrounding
+    ``radius`` days for a worker thread, so stepping through days with the
+    arrow keys renders from memory. Saves reported by the DataManager drop
+    the affected day.
+    """
+
+    def __init__(self, data_manager: DataManager, radius=3, max_entries=32):
+        self.data_manager = data_manager
+        self.dims = Dimensions()
+        self.radius = radius
+        # Always keep room for the current day and everything prefetched for it
+        self.max_entries = max(max_entries, 2 * radius + 1)
+
+        self._models: "OrderedDict[date, DayModel]" = OrderedDict()
+        # Bumped on invalidation so a prefetch started earlier is discarded
+        self._versions: Dict[date, int] = {}
+        self._condition = threading.Condition()
+        self._queue: List[date] = []
+        self._closed = False
+
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+
+        data_manager.add_save_listener(self._on_save)
+
+        self._worker = threading.Thread(
+            target=self._run, name="day-prefetch", daemon=True
+        )
+        self._worker.start()
+
+    def get(self, day: date) -> DayModel:
+        """Return the model for a day, loading it now if it is not cached"""
+        with self._condition:
+            model = self._models.get(day)
+            if model is not None:
+                self.hits += 1
+                self._models.move_to_end(day)
+                return model
+            self.misses += 1
+            version = self._versions.get(day, 0)
+
+        model = self._build(day)
+        self._store(day, model, version)
+        return model
+
+    def prefetch_around(self, day: date):
+        """Queue the days around ``day`` for loading, nearest first"""
+        wanted = []
+        for offset in range(1, self.radius + 1):
+            wanted.extend([day + timedelta(days=offset), day - timedelta(days=offset)])
+
+        with self._condition:
+            # Requests for the previous position are no longer useful
+            self._queue = [d for d in wanted if d not in self._models]
+            self._condition.notify()
+
+    def invalidate(self, day: date):
+        with self._condition:
+            self._models.pop(day, None)
+            self._versions[day] = self._versions.get(day, 0) + 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "prefetched": self.prefetched,
+                "entries": len(self._models),
+            }
+
+    def close(self):
+        """Stop the prefetch thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._worker.join()
+
+    def _on_save(self, date_str, section_name, data):
+        year, month, day = map(int, date_str.split("-"))
+        self.invalidate(date(year, month, day))
+
+    def _build(self, day: date) -> DayModel:
+        record = self.data_manager.load_day(day)
+        tasks = [Task(**block) for block in record["tasks"]]
+        top_tasks = [TopTask(**task) for task in record["top_tasks"]]
+        return DayModel(
+            date=day,
+            tasks=tasks,
+            top_tasks=top_tasks,
+            y_ranges=[
+                self.dims.task_y_range(task.start_time, task.end_time)
+                for task in tasks
+            ],
+        )
+
+    def _store(self, day: date, model: DayModel, version: int):
+        with self._condition:
+            if self._versions.get(day, 0) != version:
+                return  # Saved while loading, the model may be stale
+            self._models[day] = model
+            self._models.move_to_end(day)
+            while len(self._models) > self.max_entries:
+                self._models.popitem(last=False)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                day = self._queue.pop(0)
+                if day in self._models:
+                    continue
+                version = self._versions.get(day, 0)
+
+            try:
+                model = self._build(day)
+            except Exception:
+                # Prefetching is best effort; get() reports errors on demand
+                logger.exception("Prefetching %s failed", day)
+                continue
+            self._store(day, model, version)
+            with self._condition:
+                self.prefetched += 1
@@ -0,0 +1,194 @@
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from src.models.data_classes import Task, TopTask
+from src.storage.base import DayRecord
+
+# Bits of HistoryColumns.sections, recording which sections a day had
+HAS_TASKS = 1
+HAS_TOP_TASKS = 2
+
+
+def hours_to_minutes(hours: float) -> int:
+    """Nearest whole minute of a stored time"""
+    minutes = round(hours * 60)
+    if not 0 <= minutes <= 24 * 60:
+        raise ValueError(f"{hours!r} is not a time of day")
+    return minutes
+
+
+def minutes_to_hours(minutes: int) -> float:
+    """Hours as float, computed the way the Add Task dialog computes them"""
+    return float(minutes // 60) + float(minutes % 60) / 60
+
+
+class HistoryColumns:
+    """Compact column store of many days of time blocks and top tasks.
+
+    Every block is one entry in parallel arrays: minute offsets in
+    ``array('H')`` and an index into a table of interned names. Days are
+    kept as sorted ordinals with offsets into the block arrays, so a day's
+    blocks are a slice. Converts to and from the JSON document schema
+    without loss: the rare time that is not on a whole minute keeps its
+    exact value in a side table, while the arrays hold the nearest minute.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+
+        self.day_ordinals = array("I")
+        self.sections = array("B")
+
+        # Time blocks; a day's blocks are block_offsets[i]:block_offsets[i + 1]
+        self.block_offsets = array("I", [0])
+        self.starts = array("H")
+        self.ends = array("H")
+        self.name_ids = array("I")
+        # Block index -> exact stored hours, for times between whole minutes
+        self.exact_starts: Dict[int, float] = {}
+        self.exact_ends: Dict[int, float] = {}
+
+        # Top tasks; text ids point into the same name table
+        self.top_offsets = array("I", [0])
+        self.top_text_ids = array("I")
+        self.top_completed = array("B")
+
+    @classmethod
+    def from_days(cls, days: Iterable[Tuple[str, DayRecord]]) -> "HistoryColumns":
+        """Build from (date, record) pairs in ascending date order"""
+        columns = cls()
+        for date_str, record in days:
+            columns.append_day(date_str, record)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.day_ordinals)
+
+    def intern(self, name: str) -> int:
+        """Id of a name in the name table, adding it if new"""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return name_id
+
+    def append_day(self, date_str: str, record: DayRecord):
+        ordinal = date.fromisoformat(date_str).toordinal()
+        if self.day_ordinals and ordinal <= self.day_ordinals[-1]:
+            raise ValueError(f"{date_str} is not after the last day added")
+
+        flags = 0
+        if "tasks" in record:
+            flags |= HAS_TASKS
+            for block in record["tasks"]:
+                try:
+                    start = block["start_time"]
+                    end = block["end_time"]
+                    start_minutes = hours_to_minutes(start)
+                    end_minutes = hours_to_minutes(end)
+                    name_id = self.intern(block["name"])
+                except (KeyError, TypeError, ValueError) as error:
+                    raise ValueError(
+                        f"{date_str}: invalid time block {block!r}"
+                    ) from error
+
+                index = len(self.starts)
+                if minutes_to_hours(start_minutes) != start:
+                    self.exact_starts[index] = start
+                if minutes_to_hours(end_minutes) != end:
+                    self.exact_ends[index] = end
+                self.starts.append(start_minutes)
+                self.ends.append(end_minutes)
+                self.name_ids.append(name_id)
+        if "top_tasks" in record:
+            flags |= HAS_TOP_TASKS
+            for task in record["top_tasks"]:
+                try:
+                    text_id = self.intern(task["text"])
+                except (KeyError, TypeError) as error:
+                    raise ValueError(
+                        f"{date_str}: invalid top task {task!r}"
+                    ) from error
+                self.top_text_ids.append(text_id)
+                self.top_completed.append(bool(task.get("completed", False)))
+
+        self.day_ordinals.append(ordinal)
+        self.sections.append(flags)
+        self.block_offsets.append(len(self.starts))
+        self.top_offsets.append(len(self.top_text_ids))
+
+    def day_index(self, day: date) -> int:
+        """Position of a day, or -1 if it has no record"""
+        ordinal = day.toordinal()
+        index = bisect_left(self.day_ordinals, ordinal)
+        if index < len(self.day_ordinals) and self.day_ordinals[index] == ordinal:
+            return index
+        return -1
+
+    def record(self, index: int) -> DayRecord:
+        """The JSON record of the day at ``index``"""
+        record: DayRecord = {}
+        flags = self.sections[index]
+        if flags & HAS_TASKS:
+            record["tasks"] = [
+                {
+                    "name": self.names[self.name_ids[i]],
+                    "start_time": self.exact_starts.get(
+                        i, minutes_to_hours(self.starts[i])
+                    ),
+                    "end_time": self.exact_ends.get(i, minutes_to_hours(self.ends[i])),
+                }
+                for i in range(self.block_offsets[index], self.block_offsets[index + 1])
+            ]
+        if flags & HAS_TOP_TASKS:
+            record["top_tasks"] = [
+                {
+                    "text": self.names[self.top_text_ids[i]],
+                    "completed": bool(self.top_completed[i]),
+                }
+                for i in range(self.top_offsets[index], self.top_offsets[index + 1])
+            ]
+        return record
+
+    def to_days(self) -> Iterator[Tuple[str, DayRecord]]:
+        """(date, record) pairs in the storage schema, oldest first"""
+        for index, ordinal in enumerate(self.day_ordinals):
+            yield date.fromordinal(ordinal).isoformat(), self.record(index)
+
+    def tasks(self, day: date) -> List[Task]:
+        index = self.day_index(day)
+        if index < 0:
+            return []
+        return [Task(**block) for block in self.record(index).get("tasks", [])]
+
+    def top_tasks(self, day: date) -> List[TopTask]:
+        index = self.day_index(day)
+        if index < 0:
+            return []
+        return [TopTask(**task) for task in self.record(index).get("top_tasks", [])]
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the arrays and the name table"""
+        arrays = (
+            self.day_ordinals,
+            self.sections,
+            self.block_offsets,
+            self.starts,
+            self.ends,
+            self.name_ids,
+            self.top_offsets,
+            self.top_text_ids,
+            self.top_completed,
+        )
+        return (
+            sum(sys.getsizeof(column) for column in arrays)
+            + sys.getsizeof(self.names)
+            + sum(sys.getsizeof(name) for name in self.names)
+            + sys.getsizeof(self._name_ids)
+            + sys.getsizeof(self.exact_starts)
+            + sys.getsizeof(self.exact_ends)
+        )
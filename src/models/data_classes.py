@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -11,11 +12,53 @@ class Task:
     text_id: Optional[int] = None
 
 
+# Text of the unset priority slots shown for a day without top tasks
+PLACEHOLDER_TEXT = "Click to add priority task {}"
+PLACEHOLDER_TEXTS = frozenset(PLACEHOLDER_TEXT.format(i) for i in range(1, 4))
+
+
 @dataclass
 class TopTask:
     text: str
     completed: bool = False
 
+    @property
+    def is_placeholder(self) -> bool:
+        return self.text in PLACEHOLDER_TEXTS
+
+
+def placeholder_top_tasks() -> List[TopTask]:
+    """Unsaved priority slots for the view; stored only once edited"""
+    return [TopTask(PLACEHOLDER_TEXT.format(i)) for i in range(1, 4)]
+
+
+def is_placeholder_section(top_tasks: List[Dict]) -> bool:
+    """Whether stored priorities are only untouched placeholder slots"""
+    return all(
+        task["text"] in PLACEHOLDER_TEXTS and not task.get("completed")
+        for task in top_tasks
+    )
+
+
+@dataclass
+class DayModel:
+    """Parsed data and layout for one day, ready to be rendered"""
+
+    date: date
+    tasks: List[Task]
+    top_tasks: List[TopTask]
+    # Canvas (start_y, end_y) of each task, in the same order as tasks
+    y_ranges: List[Tuple[int, int]]
+    # Truncated task labels, filled in on first render on the Tk thread
+    labels: Optional[List[str]] = None
+
+    def copy_tasks(self) -> List[Task]:
+        """Fresh Task objects the UI can mutate without touching the cache"""
+        return [Task(t.name, t.start_time, t.end_time) for t in self.tasks]
+
+    def copy_top_tasks(self) -> List[TopTask]:
+        return [TopTask(t.text, t.completed) for t in self.top_tasks]
+
 
 @dataclass
 class InteractionState:
@@ -149,10 +192,23 @@ class Dimensions:
             + self.TIME_BLOCKS_HEIGHT
         )  # Time blocks section (including title)
 
+    def task_y_range(self, start_time: float, end_time: float) -> Tuple[int, int]:
+        """Top and bottom canvas y coordinates of a time block"""
+        return (
+            round(start_time * self.HOUR_HEIGHT),
+            round(end_time * self.HOUR_HEIGHT) - 1,
+        )
+
 
 @dataclass(frozen=True)
 class UIConfig:
+    # Storage location; the backend follows the scheme or extension:
+    # "tasks.json" / "json://...", "journal://tasks.json", "tasks.db" / "sqlite://...",
+    # "shards://data" (one file per month)
     SAVE_FILE: str = "tasks.json"
+    SAVE_DELAY: float = 0.5  # Seconds to coalesce saves before writing, 0 = sync
+    PREFETCH_DAYS: int = 3  # Days on each side of the current date to preload
+    DAY_CACHE_SIZE: int = 32  # Maximum number of day models kept in memory
     FONT_FAMILY: str = "Arial"
     FONT_SIZES: Dict[str, int] = field(
         default_factory=lambda: {"normal": 10, "bold": 12}
@@ -0,0 +1,135 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional, Tuple
+
+from src.models.data_classes import Task
+
+INF = float("inf")
+
+
+class TaskIntervalIndex:
+    """Tasks of one day kept sorted by start time.
+
+    Lookups bisect on the start times and only walk back as far as the
+    longest block can reach, so point and range queries cost O(log n + k)
+    for k matches instead of a scan over the whole day. Blocks saved before
+    overlaps were refused may still overlap; queries return all of them.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        # Parallel lists ordered by (start, end, id); the id breaks ties
+        # between equal intervals so each task has an exact position
+        self._keys: List[Tuple[float, float, int]] = []
+        self._tasks: List[Task] = []
+        # Upper bound on block length, only ever grows until the next clear
+        self._max_duration = 0.0
+        for task in tasks:
+            self.insert(task)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self):
+        return iter(list(self._tasks))
+
+    def clear(self):
+        self._keys.clear()
+        self._tasks.clear()
+        self._max_duration = 0.0
+
+    def insert(self, task: Task):
+        key = self._key(task)
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._tasks.insert(index, task)
+        self._max_duration = max(self._max_duration, task.end_time - task.start_time)
+
+    def remove(self, task: Task):
+        index = bisect_left(self._keys, self._key(task))
+        if index == len(self._tasks) or self._tasks[index] is not task:
+            raise ValueError("task is not in the index or was changed in place")
+        del self._keys[index]
+        del self._tasks[index]
+
+    def move(self, task: Task, start_time: float, end_time: float):
+        """Change a task's times and reposition it in the index"""
+        self.remove(task)
+        task.start_time = start_time
+        task.end_time = end_time
+        self.insert(task)
+
+    def at(self, time: float) -> List[Task]:
+        """Tasks covering ``time``, latest start first"""
+        return self._scan(bisect_right(self._keys, (time, INF, INF)), time)
+
+    def overlapping(
+        self, start_time: float, end_time: float, exclude: Optional[Task] = None
+    ) -> List[Task]:
+        """Tasks sharing more than an edge with [start_time, end_time)"""
+        return [
+            task
+            for task in self._scan(bisect_left(self._keys, (end_time,)), start_time)
+            if task is not exclude
+        ]
+
+    def snap(
+        self,
+        task: Task,
+        start_time: float,
+        end_time: float,
+        anchor: Optional[str] = None,
+        lower: float = 0.0,
+        upper: float = 24.0,
+    ) -> Optional[Tuple[float, float]]:
+        """Nearest free placement for ``task`` at the proposed times.
+
+        Without an anchor the block keeps its length and is pushed against
+        the blocks it would overlap. With anchor "start" or "end" that edge
+        stays put and the other one is cut back (a resize). Returns None when
+        no placement fits, in which case the move should be refused.
+        """
+        conflicts = self.overlapping(start_time, end_time, exclude=task)
+        if not conflicts:
+            return start_time, end_time
+
+        # Resizing only stops at blocks on the moving side, so blocks that
+        # already overlap the fixed edge do not lock the task in place
+        if anchor == "start":
+            ahead = [o.start_time for o in conflicts if o.start_time >= start_time]
+            end_time = min(ahead, default=end_time)
+            return (start_time, end_time) if end_time > start_time else None
+        if anchor == "end":
+            behind = [o.end_time for o in conflicts if o.end_time <= end_time]
+            start_time = max(behind, default=start_time)
+            return (start_time, end_time) if start_time < end_time else None
+
+        duration = end_time - start_time
+        candidates = [
+            max(other.end_time for other in conflicts),
+            min(other.start_time for other in conflicts) - duration,
+        ]
+        for start in sorted(candidates, key=lambda s: abs(s - start_time)):
+            end = start + duration
+            if (
+                lower <= start
+                and end <= upper
+                and not self.overlapping(start, end, exclude=task)
+            ):
+                return start, end
+        return None
+
+    def _scan(self, stop: int, time: float) -> List[Task]:
+        """Tasks before position ``stop`` that end after ``time``"""
+        found = []
+        # Blocks starting before the horizon ended before ``time``
+        horizon = time - self._max_duration
+        for index in range(stop - 1, -1, -1):
+            task = self._tasks[index]
+            if task.start_time < horizon:
+                break
+            if task.end_time > time:
+                found.append(task)
+        return found
+
+    @staticmethod
+    def _key(task: Task) -> Tuple[float, float, int]:
+        return (task.start_time, task.end_time, id(task))
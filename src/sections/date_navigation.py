@@ -1,13 +1,16 @@
 import calendar
 import tkinter as tk
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from tkinter import ttk
 
+from src.data_manager import DataManager
 from src.models.data_classes import Colors, Dimensions, UIConfig
+from src.sections.search_panel import SearchPanel
+from src.sections.stats_window import StatsWindow
 
 
 class DateNavigationBar(tk.Frame):
-    def __init__(self, parent, initial_date, on_date_change):
+    def __init__(self, parent, initial_date, on_date_change, data_manager=None):
         super().__init__(parent)
 
         # Store reference to main window
@@ -24,6 +27,9 @@ class DateNavigationBar(tk.Frame):
         self.config = UIConfig()
         self.current_date = initial_date
         self.on_date_change = on_date_change
+        self.data_manager = data_manager or DataManager()
+        self._stats_window = None
+        self._search_panel = None
 
         # Setup keyboard shortcuts
         self._setup_shortcuts()
@@ -35,6 +41,7 @@ class DateNavigationBar(tk.Frame):
         # Bind arrow keys for date navigation
         self.window.bind("<Left>", lambda e: self._change_date(-1))
         self.window.bind("<Right>", lambda e: self._change_date(1))
+        self.window.bind("<Control-f>", self._show_search)
 
     def _change_date(self, days: int):
         """Change the current date by the specified number of days"""
@@ -83,6 +90,12 @@ class DateNavigationBar(tk.Frame):
         self.date_label.pack(side="left", expand=True)
         self.date_label.bind("<Button-1>", self._show_calendar)
 
+        # Stats button, kept narrow so the date still fits
+        self.stats_button = tk.Button(
+            self, text="Σ", command=self._show_stats, **nav_button_style
+        )
+        self.stats_button.pack(side="right", padx=(0, 5), pady=5)
+
         # Today button
         self.today_button = tk.Button(
             self, text="Today", command=self._go_to_today, **today_button_style
@@ -96,7 +109,12 @@ class DateNavigationBar(tk.Frame):
         self.next_button.pack(side="right", padx=5, pady=5)
 
         # Add hover effects to all buttons
-        for button in [self.prev_button, self.today_button, self.next_button]:
+        for button in [
+            self.prev_button,
+            self.today_button,
+            self.next_button,
+            self.stats_button,
+        ]:
             self._add_button_hover_effects(button)
 
     def _add_button_hover_effects(self, button):
@@ -136,7 +154,24 @@ class DateNavigationBar(tk.Frame):
 
     def _show_calendar(self, event=None):
         """Show the calendar dialog"""
-        CalendarDialog(self, self.current_date, self._set_date)
+        CalendarDialog(self, self.current_date, self._set_date, self.data_manager)
+
+    def _show_stats(self):
+        """Open the stats window, or raise it if it is already open"""
+        if self._stats_window is not None and self._stats_window.top.winfo_exists():
+            self._stats_window.refresh()
+            self._stats_window.top.lift()
+            return
+        self._stats_window = StatsWindow(self, self.data_manager)
+
+    def _show_search(self, event=None):
+        """Open the search panel, or focus it if it is already open"""
+        if self._search_panel is not None and self._search_panel.top.winfo_exists():
+            self._search_panel.top.lift()
+            self._search_panel.entry.focus_set()
+        else:
+            self._search_panel = SearchPanel(self, self.data_manager, self._set_date)
+        return "break"
 
     def _set_date(self, new_date):
         """Set the current date and update the view"""
@@ -146,12 +181,17 @@ class DateNavigationBar(tk.Frame):
 
 
 class CalendarDialog:
-    def __init__(self, parent, current_date, callback):
+    # Enough cells for the longest month layout, six weeks
+    WEEKS = 6
+
+    def __init__(self, parent, current_date, callback, data_manager=None):
         self.colors = Colors()
         self.top = tk.Toplevel(parent)
         self.top.title("Select Date")
         self.callback = callback
         self.current_date = current_date
+        # Day summaries come from the rollups, so months render from memory
+        self.data_manager = data_manager
 
         # Set up variables
         self.year = current_date.year
@@ -177,6 +217,12 @@ class CalendarDialog:
             foreground=self.colors.PRIORITY_TASK_TEXT,
             font=("Arial", 10, "bold"),
         )
+        style.configure("CalendarBlocks.TButton", font=("Arial", 9, "bold"))
+        style.configure(
+            "CalendarDone.TButton",
+            font=("Arial", 9, "bold"),
+            foreground=self.colors.PRIORITY_TASK_COMPLETED,
+        )
 
         # Month and Year Navigation
         nav_frame = ttk.Frame(self.top)
@@ -204,6 +250,18 @@ class CalendarDialog:
                 row=0, column=i, padx=2, pady=2
             )
 
+        # Day cells are created once and reconfigured for each month
+        self.cells = []
+        self.cell_days = [0] * (self.WEEKS * 7)
+        for index in range(self.WEEKS * 7):
+            cell = ttk.Button(
+                self.cal_frame,
+                width=6,
+                command=lambda i=index: self._select_date(self.cell_days[i]),
+            )
+            cell.grid(row=index // 7 + 1, column=index % 7, padx=1, pady=1)
+            self.cells.append(cell)
+
         self._draw_calendar()
 
     def _draw_calendar(self):
@@ -212,33 +270,42 @@ class CalendarDialog:
             text=f"{calendar.month_name[self.month]} {self.year}"
         )
 
-        # Clear existing calendar buttons
-        for widget in self.cal_frame.grid_slaves():
-            if widget.grid_info()["row"] > 0:  # Don't remove headers
-                widget.destroy()
-
         # Get calendar for current month
         cal = calendar.monthcalendar(self.year, self.month)
+        summaries = {}
+        if self.data_manager is not None:
+            last_day = calendar.monthrange(self.year, self.month)[1]
+            summaries = self.data_manager.rollups.days_between(
+                date(self.year, self.month, 1), date(self.year, self.month, last_day)
+            )
 
-        # Create date buttons
         today = datetime.now().date()
-        for week_num, week in enumerate(cal, 1):
-            for day_num, day in enumerate(week):
-                if day != 0:
-                    btn = ttk.Button(
-                        self.cal_frame,
-                        text=str(day),
-                        width=4,
-                        command=lambda d=day: self._select_date(d),
-                    )
-                    btn.grid(row=week_num, column=day_num, padx=1, pady=1)
-
-                    # Highlight current date
-                    date = datetime(self.year, self.month, day).date()
-                    if date == today:
-                        btn.state(["pressed"])  # Visual indication for today
-                    elif date == self.current_date:
-                        btn.state(["alternate"])  # Visual indication for selected date
+        for index, cell in enumerate(self.cells):
+            week_num, day_num = divmod(index, 7)
+            day = cal[week_num][day_num] if week_num < len(cal) else 0
+            self.cell_days[index] = day
+            if day == 0:
+                cell.grid_remove()
+                continue
+
+            cell_date = date(self.year, self.month, day)
+            summary = summaries.get(cell_date.isoformat())
+            text, style = f"{day}\n", "TButton"
+            if summary and summary["blocks"]:
+                text += f"{summary['minutes'] / 60:.1f}h"
+                style = "CalendarBlocks.TButton"
+            if summary and summary["top_done"] >= 3:
+                text += " ✓"  # All three priorities completed
+                style = "CalendarDone.TButton"
+            cell.configure(text=text, style=style)
+
+            # Highlight today and the selected date
+            cell.state(["!pressed", "!alternate"])
+            if cell_date == today:
+                cell.state(["pressed"])
+            elif cell_date == self.current_date:
+                cell.state(["alternate"])
+            cell.grid()
 
     def _prev_month(self):
         self.month -= 1
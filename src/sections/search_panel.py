@@ -0,0 +1,112 @@
+import tkinter as tk
+from datetime import date
+from tkinter import ttk
+
+from src.data_manager import DataManager
+from src.models.data_classes import Colors, UIConfig
+
+
+class SearchPanel:
+    """Find days by block name or priority text and jump to them"""
+
+    # Milliseconds to wait after the last keystroke before searching
+    SEARCH_DELAY = 150
+
+    def __init__(self, parent, data_manager: DataManager, on_select):
+        self.colors = Colors()
+        self.config = UIConfig()
+        self.data_manager = data_manager
+        self.on_select = on_select
+        self._pending_search = None
+        self._result_dates = []
+
+        self.top = tk.Toplevel(parent)
+        self.top.title("Search")
+        self.top.configure(bg=self.colors.BACKGROUND[0])
+        self.top.transient(parent)
+
+        self._setup_ui()
+        self.top.bind("<Escape>", lambda e: self.top.destroy())
+
+    def _setup_ui(self):
+        self.query = tk.StringVar()
+        self.query.trace_add("write", lambda *args: self._schedule_search())
+
+        self.entry = ttk.Entry(
+            self.top, textvariable=self.query, font=(self.config.FONT_FAMILY, 11)
+        )
+        self.entry.pack(fill="x", padx=5, pady=5)
+        self.entry.bind("<Return>", self._select_first)
+        self.entry.bind("<Down>", lambda e: self._focus_results())
+
+        frame = ttk.Frame(self.top)
+        frame.pack(fill="both", expand=True, padx=5)
+        self.results = tk.Listbox(
+            frame,
+            width=60,
+            height=15,
+            font=(self.config.FONT_FAMILY, 10),
+            fg=self.colors.PRIORITY_TASK_TEXT,
+            activestyle="none",
+        )
+        scrollbar = ttk.Scrollbar(frame, command=self.results.yview)
+        self.results.configure(yscrollcommand=scrollbar.set)
+        self.results.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        self.results.bind("<Double-Button-1>", self._select_current)
+        self.results.bind("<Return>", self._select_current)
+
+        self.status_label = ttk.Label(self.top, text="")
+        self.status_label.pack(fill="x", padx=5, pady=(2, 5))
+
+        self.entry.focus_set()
+
+    def _schedule_search(self):
+        """Search once typing pauses instead of on every keystroke"""
+        if self._pending_search is not None:
+            self.top.after_cancel(self._pending_search)
+        self._pending_search = self.top.after(self.SEARCH_DELAY, self._search)
+
+    def _search(self):
+        self._pending_search = None
+        query = self.query.get()
+        total, results = self.data_manager.search(query) if query.strip() else (0, [])
+
+        self.results.delete(0, "end")
+        self._result_dates = []
+        for date_str, texts in results:
+            day = date.fromisoformat(date_str)
+            self.results.insert("end", f"{day:%a %d %b %Y}   {', '.join(texts)}")
+            self._result_dates.append(day)
+
+        if not query.strip():
+            self.status_label.config(text="")
+        else:
+            status = f"{total} day{'s' * (total != 1)}"
+            if total > len(results):
+                status += f", newest {len(results)} shown"
+            self.status_label.config(text=status)
+
+    def _focus_results(self):
+        if self._result_dates:
+            self.results.focus_set()
+            self.results.selection_clear(0, "end")
+            self.results.selection_set(0)
+            self.results.activate(0)
+
+    def _select_first(self, event=None):
+        if self._pending_search is not None:
+            # Enter pressed before the delayed search ran
+            self.top.after_cancel(self._pending_search)
+            self._search()
+        if self._result_dates:
+            self._open(self._result_dates[0])
+
+    def _select_current(self, event=None):
+        selection = self.results.curselection()
+        if selection:
+            self._open(self._result_dates[selection[0]])
+
+    def _open(self, day: date):
+        # The panel stays open so other results can be visited
+        self.on_select(day)
@@ -0,0 +1,101 @@
+import tkinter as tk
+from datetime import date
+from tkinter import ttk
+
+from src.data_manager import DataManager
+from src.models.data_classes import Colors
+
+COLUMNS = ("period", "hours", "blocks", "priorities", "all_done")
+HEADINGS = {
+    "period": "Period",
+    "hours": "Planned hours",
+    "blocks": "Blocks",
+    "priorities": "Priorities done",
+    "all_done": "Days all done",
+}
+
+
+class StatsWindow:
+    """Weekly and monthly totals read from the DataManager rollups"""
+
+    WEEKS_SHOWN = 12
+    MONTHS_SHOWN = 12
+
+    def __init__(self, parent, data_manager: DataManager):
+        self.colors = Colors()
+        self.data_manager = data_manager
+
+        self.top = tk.Toplevel(parent)
+        self.top.title("Stats")
+        self.top.configure(bg=self.colors.BACKGROUND[0])
+        self.top.transient(parent)
+
+        self._setup_ui()
+        self.refresh()
+        # Saves made while the window is open show up when it is focused again
+        self.top.bind("<FocusIn>", self._on_focus)
+
+    def _setup_ui(self):
+        notebook = ttk.Notebook(self.top)
+        notebook.pack(fill="both", expand=True, padx=5, pady=5)
+        self.tables = {}
+        for name in ("Weekly", "Monthly"):
+            table = ttk.Treeview(notebook, columns=COLUMNS, show="headings", height=12)
+            for column in COLUMNS:
+                table.heading(column, text=HEADINGS[column])
+                table.column(column, width=110, anchor="e")
+            table.column("period", anchor="w")
+            notebook.add(table, text=name)
+            self.tables[name] = table
+
+        footer = ttk.Frame(self.top)
+        footer.pack(fill="x", padx=5, pady=(0, 5))
+        self.status_label = ttk.Label(footer, text="")
+        self.status_label.pack(side="left")
+        ttk.Button(footer, text="Rebuild", command=self._rebuild).pack(side="right")
+
+    def refresh(self):
+        rollups = self.data_manager.rollups
+        weeks = [
+            (f"Week of {date.fromisoformat(week):%d %b %Y}", totals)
+            for week, totals in rollups.weeks(self.WEEKS_SHOWN)
+        ]
+        months = [
+            (date.fromisoformat(f"{month}-01").strftime("%B %Y"), totals)
+            for month, totals in rollups.months(self.MONTHS_SHOWN)
+        ]
+        self._fill(self.tables["Weekly"], weeks)
+        self._fill(self.tables["Monthly"], months)
+
+    def _fill(self, table: ttk.Treeview, rows):
+        table.delete(*table.get_children())
+        # Newest period first
+        for label, totals in reversed(rows):
+            done, total = totals["top_done"], totals["top_set"]
+            priorities = f"{done}/{total} ({done / total:.0%})" if total else "-"
+            table.insert(
+                "",
+                "end",
+                values=(
+                    label,
+                    f"{totals['minutes'] / 60:.1f}",
+                    totals["blocks"],
+                    priorities,
+                    totals["days_all_done"],
+                ),
+            )
+
+    def _rebuild(self):
+        """Recompute the rollups, e.g. after the data file was edited by hand"""
+        self.top.config(cursor="watch")
+        self.top.update_idletasks()
+        try:
+            days = self.data_manager.rebuild_rollups()
+        finally:
+            self.top.config(cursor="")
+        self.status_label.config(text=f"Rebuilt from {days} days")
+        self.refresh()
+
+    def _on_focus(self, event):
+        if event.widget is self.top:
+            self.refresh()
@@ -4,12 +4,20 @@ from tkinter import StringVar, Toplevel, messagebox, ttk
 from typing import Optional
 
 from src.data_manager import DataManager
-from src.models.data_classes import Colors, Dimensions, Task, UIConfig
+from src.models.data_classes import Colors, DayModel, Dimensions, Task, UIConfig
+from src.models.interval_index import TaskIntervalIndex
+from src.utils.profiling import profiled, profiler
+from src.utils.text_layout import TextLayout
 from src.utils.tooltip import TooltipManager
 
 
 class TimeBlocksSection(tk.Frame):
-    def __init__(self, parent, current_date):
+    # Width available for a task label inside its box, in pixels
+    TASK_TEXT_WIDTH = 220
+    # Milliseconds between rendered drag and resize steps, about 60 per second
+    FRAME_INTERVAL = 16
+
+    def __init__(self, parent, current_date, data_manager=None):
         super().__init__(parent)
 
         # Store reference to main window
@@ -19,12 +27,23 @@ class TimeBlocksSection(tk.Frame):
         self.dims = Dimensions()
         self.colors = Colors()
         self.config = UIConfig()
-        self.data_manager = DataManager()
+        self.data_manager = data_manager or DataManager()
+        self.text_layout = TextLayout.shared()
+        self.task_font = (
+            self.config.FONT_FAMILY,
+            self.config.FONT_SIZES["normal"],
+            "bold",
+        )
 
         # Initialize tracking attributes
         self.current_date = current_date
         self.tasks = []
+        # Same tasks sorted by time, for hit-testing and overlap checks
+        self.task_index = TaskIntervalIndex()
         self.canvases = {}
+        # Task name each text item was laid out for, keyed by text item id
+        self._task_labels = {}
+        self._hover_task: Optional[Task] = None
 
         # Initialize interaction state
         self.dragging = False
@@ -36,6 +55,15 @@ class TimeBlocksSection(tk.Frame):
         self.original_end_time = 0
         self.drag_offset = 0
 
+        # Latest drag/resize motion not rendered yet and the scheduled render;
+        # motions arriving within one frame collapse into the last of them
+        self._pending_motion = None
+        self._motion_frame = None
+        self.motion_events = 0
+        self.motion_coalesced = 0
+        self.motion_frames = 0
+        profiler.add_counters("time_blocks.motion", self._motion_stats)
+
         # Initialize scheduled update reference
         self._scheduled_update = None
 
@@ -215,8 +243,20 @@ class TimeBlocksSection(tk.Frame):
         task_canvas.bind("<B1-Motion>", self._on_drag_motion)
         task_canvas.bind("<ButtonRelease-1>", self._on_drag_release)
 
+        # Tasks are found through task_index instead of per-item bindings,
+        # so redraws never touch the Tcl binding tables
+        task_canvas.bind("<Motion>", self._on_canvas_motion)
+        task_canvas.bind("<Leave>", self._on_canvas_leave)
+        task_canvas.tag_bind("task", "<Button-1>", self._on_canvas_press)
+        task_canvas.tag_bind("task", "<Double-Button-1>", self._on_canvas_double_click)
+
+    @profiled("time_blocks.draw_hour_grid")
     def _draw_hour_grid(self):
-        """Optimized hour grid drawing using pre-calculated positions"""
+        """Draw the hour grid and labels once as a persistent canvas layer.
+
+        Date changes only delete items tagged "task", so the grid never has
+        to be rebuilt.
+        """
         for canvas in self.canvases.values():
             for y_pos, bg_color in self.HOUR_POSITIONS:
                 canvas.create_rectangle(
@@ -226,20 +266,24 @@ class TimeBlocksSection(tk.Frame):
                     y_pos + self.dims.HOUR_HEIGHT,
                     fill=bg_color,
                     outline="",
+                    tags=("grid",),
                 )
 
-        # Draw hour labels only once
+        # Hour labels are canvas text items rather than embedded Label widgets
         time_canvas = self.canvases["time"]
-        for hour, (y_pos, bg_color) in enumerate(self.HOUR_POSITIONS):
-            label = tk.Label(
-                time_canvas,
+        for hour, (y_pos, _) in enumerate(self.HOUR_POSITIONS):
+            time_canvas.create_text(
+                7,  # Label origin plus its border and padding
+                y_pos + 3,
                 text=f"{hour:02}:00",
                 font=(self.config.FONT_FAMILY, self.config.FONT_SIZES["normal"]),
-                bg=bg_color,
-                fg="#38352A",
-                anchor="w",
+                fill="#38352A",
+                anchor="nw",
+                tags=("grid", "hour_label"),
             )
-            time_canvas.create_window(5, y_pos + 1, window=label, anchor="nw")
+
+        for canvas in self.canvases.values():
+            canvas.tag_lower("grid")
 
     def _show_add_task_dialog(self, task: Optional[Task] = None):
         dialog = Toplevel(self.window)  # Use stored window reference
@@ -380,6 +424,7 @@ class TimeBlocksSection(tk.Frame):
         # Save using data manager
         self.data_manager.save_time_blocks(self.current_date, tasks_data)
 
+    @profiled("time_blocks.save_task")
     def _save_task(
         self,
         dialog,
@@ -409,16 +454,24 @@ class TimeBlocksSection(tk.Frame):
             messagebox.showerror("Error", "End time cannot be after midnight")
             return
 
+        conflicts = self.task_index.overlapping(
+            start_time, end_time, exclude=existing_task
+        )
+        if conflicts:
+            names = ", ".join(f'"{task.name}"' for task in conflicts)
+            messagebox.showerror("Error", f"Time block overlaps with {names}")
+            return
+
         # If editing existing task
         if existing_task:
             existing_task.name = name
-            existing_task.start_time = start_time
-            existing_task.end_time = end_time
+            self.task_index.move(existing_task, start_time, end_time)
             self._update_task_position(existing_task)
         else:
             # Create new task
             new_task = Task(name=name, start_time=start_time, end_time=end_time)
             self.tasks.append(new_task)
+            self.task_index.insert(new_task)
             self._draw_task_on_canvas(new_task)
 
         self._save_time_blocks()
@@ -427,12 +480,14 @@ class TimeBlocksSection(tk.Frame):
     def _delete_task(self, dialog, task: Task):
         self._remove_task_from_canvas(task)
         self.tasks.remove(task)
+        self.task_index.remove(task)
         self._save_time_blocks()
         dialog.destroy()
 
-    def _draw_task_on_canvas(self, task: Task):
-        start_y = round(task.start_time * self.dims.HOUR_HEIGHT)
-        end_y = round(task.end_time * self.dims.HOUR_HEIGHT) - 1
+    @profiled("time_blocks.draw_task_on_canvas")
+    def _draw_task_on_canvas(self, task: Task, y_range=None, display_text=None):
+        """Create the box and label of a task, using precomputed layout if given"""
+        start_y, end_y = y_range or self._task_y_range(task)
 
         task.box_id = self._create_rounded_rectangle(
             self.canvases["task"],
@@ -444,32 +499,16 @@ class TimeBlocksSection(tk.Frame):
             self.colors.TASK,
             self.colors.BORDER_DEFAULT,
             self.dims.BORDER_WIDTH,
+            tags=("task",),
         )
 
         # Calculate center position for text
         text_y = start_y + ((end_y - start_y) / 2)
 
-        # Calculate available width for text
-        available_width = 220  # 270 - 30 - padding
-
-        # Create temporary text to check width
-        temp_text = self.canvases["task"].create_text(
-            0,
-            0,  # Position doesn't matter for measurement
-            text=task.name,
-            font=(self.config.FONT_FAMILY, self.config.FONT_SIZES["normal"], "bold"),
-        )
-        bbox = self.canvases["task"].bbox(temp_text)
-        self.canvases["task"].delete(temp_text)
-
-        text_width = bbox[2] - bbox[0]
-
-        # Truncate text if necessary
-        display_text = task.name
-        if text_width > available_width:
-            display_text = (
-                task.name[: int(len(task.name) * (available_width / text_width) - 3)]
-                + "..."
+        # Truncate text to the available width (270 - 30 - padding)
+        if display_text is None:
+            display_text = self.text_layout.truncate(
+                self.task_font, task.name, self.TASK_TEXT_WIDTH
             )
 
         task.text_id = self.canvases["task"].create_text(
@@ -477,129 +516,92 @@ class TimeBlocksSection(tk.Frame):
             text_y,
             text=display_text,
             anchor="center",
-            font=(self.config.FONT_FAMILY, self.config.FONT_SIZES["normal"], "bold"),
+            font=self.task_font,
             fill="#38352A",
-            tags=("task_text", str(task.text_id)),
+            tags=("task", "task_text"),
         )
+        self._task_labels[task.text_id] = task.name
 
-        # Add tooltip if text was truncated
-        if display_text != task.name:
-            TooltipManager.setup_tooltip(
-                self.canvases["task"],  # Changed from canvas to self.canvases["task"]
-                task.name,
-                self.config.FONT_FAMILY,
-                self.config.FONT_SIZES["normal"],
-                self.window,
-                is_canvas=True,
-                item_ids=[task.box_id, task.text_id],
-            )
-
-        self._bind_task_events(task)
-
+    @profiled("time_blocks.update_task_position")
     def _update_task_position(self, task: Task):
-        canvas = self.canvases["task"]
-        start_y = round(task.start_time * self.dims.HOUR_HEIGHT)
-        end_y = round(task.end_time * self.dims.HOUR_HEIGHT) - 1
-
-        border_color = (
-            self.colors.BORDER_ACTIVE
-            if (self.dragging and task == self.active_task)
-            else self.colors.BORDER_DEFAULT
-        )
-        fill_color = (
-            self.colors.TASK_ACTIVE
-            if (self.dragging and task == self.active_task)
-            else self.colors.TASK
-        )
-
-        canvas.delete(task.box_id)
-        task.box_id = self._create_rounded_rectangle(
-            canvas,
-            30,
-            start_y,
-            270,
-            end_y,
-            self.dims.CORNER_RADIUS,
-            fill_color,
-            border_color,
-            self.dims.BORDER_WIDTH,
-        )
-
-        canvas.delete(task.text_id)
+        """Move a task's existing canvas items to match its times.
 
-        # Calculate center position for text
-        text_y = start_y + ((end_y - start_y) / 2)
-
-        # Calculate available width for text
-        available_width = 220  # 270 - 30 - padding
+        Items are only recreated when the label needs a new layout, i.e. when
+        the task name changed; drag and resize just move the box and text.
+        """
+        canvas = self.canvases["task"]
+        if task.box_id is None or self._task_labels.get(task.text_id) != task.name:
+            self._remove_task_from_canvas(task)
+            self._draw_task_on_canvas(task)
 
-        # Create temporary text to check width
-        temp_text = canvas.create_text(
-            0,
-            0,
-            text=task.name,
-            font=(self.config.FONT_FAMILY, self.config.FONT_SIZES["normal"], "bold"),
+        start_y, end_y = self._task_y_range(task)
+        canvas.coords(
+            task.box_id,
+            *self._rounded_rectangle_points(
+                30, start_y, 270, end_y, self.dims.CORNER_RADIUS
+            ),
         )
-        bbox = canvas.bbox(temp_text)
-        canvas.delete(temp_text)
+        canvas.coords(task.text_id, 150, start_y + ((end_y - start_y) / 2))
 
-        text_width = bbox[2] - bbox[0]
-
-        # Truncate text if necessary
-        display_text = task.name
-        if text_width > available_width:
-            display_text = (
-                task.name[: int(len(task.name) * (available_width / text_width) - 3)]
-                + "..."
+        if self.dragging and task == self.active_task:
+            canvas.itemconfig(
+                task.box_id,
+                fill=self.colors.TASK_ACTIVE,
+                outline=self.colors.BORDER_ACTIVE,
             )
-
-        task.text_id = canvas.create_text(
-            150,
-            text_y,
-            text=display_text,
-            anchor="center",
-            font=(self.config.FONT_FAMILY, self.config.FONT_SIZES["normal"], "bold"),
-            fill="#38352A",
-            tags=("task_text", str(task.text_id)),
-        )
-
-        # Add tooltip if text was truncated
-        if display_text != task.name:
-            TooltipManager.setup_tooltip(
-                canvas,
-                task.name,
-                self.config.FONT_FAMILY,
-                self.config.FONT_SIZES["normal"],
-                self.window,
-                is_canvas=True,
-                item_ids=[task.box_id, task.text_id],
+            # Keep the dragged block above the blocks it passes over
+            canvas.tag_raise(task.box_id)
+            canvas.tag_raise(task.text_id)
+        else:
+            canvas.itemconfig(
+                task.box_id, fill=self.colors.TASK, outline=self.colors.BORDER_DEFAULT
             )
 
-        self._bind_task_events(task)
+    def _task_y_range(self, task: Task):
+        """Return the top and bottom canvas y coordinates of a task"""
+        return self.dims.task_y_range(task.start_time, task.end_time)
 
-    def _bind_task_events(self, task):
-        """Bind events to task elements"""
+    def _task_under_pointer(self, event) -> Optional[Task]:
+        """Return the task drawn at the pointer position of an event"""
         canvas = self.canvases["task"]
-        for item_id in [task.box_id, task.text_id]:
-            canvas.tag_bind(
-                item_id, "<Enter>", lambda e, t=task: self._on_task_enter(e, t)
-            )
-            canvas.tag_bind(
-                item_id, "<Leave>", lambda e, t=task: self._on_task_leave(e, t)
-            )
-            canvas.tag_bind(
-                item_id, "<Motion>", lambda e, t=task: self._on_task_motion(e, t)
-            )
-            canvas.tag_bind(
-                item_id, "<Button-1>", lambda e, t=task: self._start_drag(e, t)
-            )
-            canvas.tag_bind(
-                item_id,
-                "<Double-Button-1>",
-                lambda e, t=task: self._show_add_task_dialog(t),
-            )
+        if not 30 <= canvas.canvasx(event.x) <= 270:
+            return None
+        tasks = self.task_index.at(canvas.canvasy(event.y) / self.dims.HOUR_HEIGHT)
+        return tasks[0] if tasks else None
+
+    @profiled("time_blocks.on_canvas_motion")
+    def _on_canvas_motion(self, event):
+        """Dispatch hover events to the task under the pointer"""
+        task = self._task_under_pointer(event)
+        if task is not self._hover_task:
+            if self._hover_task is not None:
+                self._on_task_leave(event, self._hover_task)
+            self._hover_task = task
+            if task is not None:
+                self._on_task_enter(event, task)
+        if task is not None:
+            self._on_task_motion(event, task)
+
+    def _on_canvas_leave(self, event):
+        """Treat leaving the canvas as leaving the hovered task"""
+        if self._hover_task is not None:
+            self._on_task_leave(event, self._hover_task)
+            self._hover_task = None
+
+    @profiled("time_blocks.on_canvas_press")
+    def _on_canvas_press(self, event):
+        task = self._task_under_pointer(event)
+        if task is not None:
+            self._start_drag(event, task)
+
+    def _on_canvas_double_click(self, event):
+        task = self._task_under_pointer(event)
+        if task is not None:
+            self._show_add_task_dialog(task)
 
     def _handle_task_interaction(self, event, task, interaction_type, edge=None):
+        # A tooltip still waiting for its delay must not appear mid-drag
+        TooltipManager.hide_tooltip(self.canvases["task"])
         self.dragging = interaction_type == "drag"
         self.resizing = interaction_type == "resize"
         self.resize_edge = edge
@@ -617,11 +619,25 @@ class TimeBlocksSection(tk.Frame):
 
     def _on_task_enter(self, event, task: Task):
         """Handle mouse enter event for task"""
-        if not (self.dragging or self.resizing):
-            self.canvases["task"].itemconfig(task.box_id, outline="#2b579a")
+        if self.dragging or self.resizing:
+            return
+
+        canvas = self.canvases["task"]
+        canvas.itemconfig(task.box_id, outline="#2b579a")
+
+        # Show the full name if the label was truncated
+        if canvas.itemcget(task.text_id, "text") != task.name:
+            TooltipManager.show_tooltip(
+                canvas,
+                task.name,
+                self.config.FONT_FAMILY,
+                self.config.FONT_SIZES["normal"],
+                item_id=task.text_id,
+            )
 
     def _on_task_leave(self, event, task):
         """Handle mouse leave event for task"""
+        TooltipManager.hide_tooltip(self.canvases["task"])
         if self.dragging or self.resizing:
             return
 
@@ -640,21 +656,6 @@ class TimeBlocksSection(tk.Frame):
         task_y = event.y - (task.start_time * self.dims.HOUR_HEIGHT)
         task_height = (task.end_time - task.start_time) * self.dims.HOUR_HEIGHT
 
-        canvas = self.canvases["task"]
-        mouse_x = canvas.canvasx(event.x)
-        mouse_y = canvas.canvasy(event.y)
-        bbox = canvas.bbox(task.box_id)
-
-        if not bbox:
-            self.window.config(cursor="")
-            return
-
-        x1, y1, x2, y2 = bbox
-        if not (x1 <= mouse_x <= x2 and y1 <= mouse_y <= y2):
-            self.window.config(cursor="")
-            canvas.itemconfig(task.box_id, outline="#bfbfbf")
-            return
-
         # Set cursor based on position within task
         if task_y <= 3:
             self.window.config(cursor="sb_v_double_arrow")
@@ -675,35 +676,69 @@ class TimeBlocksSection(tk.Frame):
             self._handle_task_interaction(event, task, "drag")
             self._update_task_position(task)
 
+    @profiled("time_blocks.on_drag_motion")
     def _on_drag_motion(self, event):
         if not (self.dragging or self.resizing):
             return
 
+        self.motion_events += 1
+        if self._pending_motion is not None:
+            self.motion_coalesced += 1
+        self._pending_motion = event
+        if self._motion_frame is None:
+            self._motion_frame = self.after_idle(self._render_motion)
+
+    @profiled("time_blocks.render_motion")
+    def _render_motion(self):
+        """Apply the latest pointer position, at most once per frame"""
+        event, self._pending_motion = self._pending_motion, None
+        if event is None:
+            # Nothing moved during the last frame, render the next one at once
+            self._motion_frame = None
+            return
+
+        self._apply_motion(event)
+        self.motion_frames += 1
+        self._motion_frame = self.after(self.FRAME_INTERVAL, self._render_motion)
+
+    def _flush_motion(self):
+        """Apply a pending motion now and stop the frame timer"""
+        if self._motion_frame is not None:
+            self.after_cancel(self._motion_frame)
+            self._motion_frame = None
+        event, self._pending_motion = self._pending_motion, None
+        if event is not None:
+            self._apply_motion(event)
+
+    def _apply_motion(self, event):
         if self.resizing:
             self._handle_resize_motion(event)
-        else:
+        elif self.dragging:
             self._handle_drag_motion(event)
 
+    def _motion_stats(self):
+        """Drag/resize motion counters for profiler dumps"""
+        return {
+            "events": self.motion_events,
+            "coalesced": self.motion_coalesced,
+            "frames": self.motion_frames,
+        }
+
+    @profiled("time_blocks.on_drag_release")
     def _on_drag_release(self, event):
         """Handle drag release"""
         if not (self.dragging or self.resizing) or not self.active_task:
             return
 
-        canvas = self.canvases["task"]
-        mouse_x = canvas.canvasx(event.x)
-        mouse_y = canvas.canvasy(event.y)
-        bbox = canvas.bbox(self.active_task.box_id)
-
-        if bbox:
-            x1, y1, x2, y2 = bbox
-            outline = (
-                "#2b579a"
-                if (x1 <= mouse_x <= x2 and y1 <= mouse_y <= y2)
-                else "#bfbfbf"
-            )
-            canvas.itemconfig(
-                self.active_task.box_id, fill=self.colors.TASK, outline=outline
-            )
+        # The block ends where the last motion put it, rendered or not
+        self._flush_motion()
+
+        hovered = self._task_under_pointer(event) is self.active_task
+        self.canvases["task"].itemconfig(
+            self.active_task.box_id,
+            fill=self.colors.TASK,
+            outline="#2b579a" if hovered else "#bfbfbf",
+        )
 
         self.window.config(cursor="")
 
@@ -718,7 +753,15 @@ class TimeBlocksSection(tk.Frame):
         ]
         self.data_manager.save_time_blocks(self.current_date, tasks_data)
 
-        # Reset interaction state
+        self._reset_interaction()
+
+    def _reset_interaction(self):
+        """End any drag or resize, dropping motions not rendered yet"""
+        if self._motion_frame is not None:
+            self.after_cancel(self._motion_frame)
+            self._motion_frame = None
+        self._pending_motion = None
+
         self.dragging = False
         self.resizing = False
         self.resize_edge = None
@@ -736,13 +779,20 @@ class TimeBlocksSection(tk.Frame):
         new_y = round((event.y / self.dims.HOUR_HEIGHT) * 4) / 4
 
         if self.resize_edge == "top":
-            if 0 <= new_y < task.end_time - 0.25:  # minimum 15 minutes
-                task.start_time = new_y
-                self._update_task_position(task)
+            if not 0 <= new_y < task.end_time - 0.25:  # minimum 15 minutes
+                return
+            # Stop at the end of the block above instead of overlapping it
+            placement = self.task_index.snap(task, new_y, task.end_time, "end")
         elif self.resize_edge == "bottom":
-            if task.start_time + 0.25 < new_y <= 24:  # minimum 15 minutes
-                task.end_time = new_y
-                self._update_task_position(task)
+            if not task.start_time + 0.25 < new_y <= 24:  # minimum 15 minutes
+                return
+            placement = self.task_index.snap(task, task.start_time, new_y, "start")
+        else:
+            return
+
+        if placement and placement[1] - placement[0] >= 0.25:
+            self.task_index.move(task, *placement)
+            self._update_task_position(task)
 
     def _handle_drag_motion(self, event):
         if not self.active_task:
@@ -758,16 +808,26 @@ class TimeBlocksSection(tk.Frame):
         new_end_time = self.original_end_time + time_delta
 
         if 0 <= new_start_time and new_end_time <= 24:
-            task.start_time = new_start_time
-            task.end_time = new_end_time
-            self._update_task_position(task)
+            # Push against blocks in the way; stay put if the block cannot fit
+            placement = self.task_index.snap(task, new_start_time, new_end_time)
+            if placement and placement != (task.start_time, task.end_time):
+                self.task_index.move(task, *placement)
+                self._update_task_position(task)
 
     def _create_rounded_rectangle(
-        self, canvas, x1, y1, x2, y2, radius, fill, outline="", width=1
+        self, canvas, x1, y1, x2, y2, radius, fill, outline="", width=1, tags=()
     ):
         """Create a rounded rectangle using a polygon with smooth corners"""
+        points = self._rounded_rectangle_points(x1, y1, x2, y2, radius)
+        return canvas.create_polygon(
+            points, smooth=True, fill=fill, outline=outline, width=width, tags=tags
+        )
+
+    @staticmethod
+    def _rounded_rectangle_points(x1, y1, x2, y2, radius):
+        """Polygon points for a rounded rectangle, used with smooth=True"""
         # Calculate points for the rounded corners
-        points = [
+        return [
             x1 + radius,
             y1,  # Top edge
             x2 - radius,
@@ -794,26 +854,47 @@ class TimeBlocksSection(tk.Frame):
             y1,  # Top left corner
         ]
 
-        return canvas.create_polygon(
-            points, smooth=True, fill=fill, outline=outline, width=width
-        )
-
-    def load_blocks(self, date):
-        """Load time blocks for a specific date"""
+    @profiled("time_blocks.load_blocks")
+    def load_blocks(self, date, model: Optional[DayModel] = None):
+        """Load time blocks for a specific date, from a cached day model if given"""
         self.current_date = date
+        # A drag still running on the previous day (the date was changed with
+        # the button held) would move a block that is no longer indexed
+        if self.dragging or self.resizing:
+            self._reset_interaction()
+            self.window.config(cursor="")
         self.tasks.clear()
-        for canvas in self.canvases.values():
-            canvas.delete("all")
-        self._draw_hour_grid()
-
-        blocks = self.data_manager.load_time_blocks(date)
-        for block_data in blocks:
-            task = Task(**block_data)
-            self.tasks.append(task)
-            self._draw_task_on_canvas(task)
-
-        if self.current_date == datetime.now().date():
-            self._schedule_next_time_update()
+        self.task_index.clear()
+        self._task_labels.clear()
+        self._hover_task = None
+        TooltipManager.hide_tooltip(self.canvases["task"])
+        self.canvases["task"].delete("task")
+
+        if model is None:
+            blocks = self.data_manager.load_time_blocks(date)
+            for block_data in blocks:
+                task = Task(**block_data)
+                self.tasks.append(task)
+                self.task_index.insert(task)
+                self._draw_task_on_canvas(task)
+        else:
+            if model.labels is None:
+                # Measured here because fonts may only be used on the Tk thread
+                model.labels = [
+                    self.text_layout.truncate(
+                        self.task_font, task.name, self.TASK_TEXT_WIDTH
+                    )
+                    for task in model.tasks
+                ]
+            for task, y_range, label in zip(
+                model.copy_tasks(), model.y_ranges, model.labels
+            ):
+                self.tasks.append(task)
+                self.task_index.insert(task)
+                self._draw_task_on_canvas(task, y_range, label)
+
+        # Draws the time marker for today and removes it for other days
+        self._schedule_next_time_update()
 
     def _schedule_next_time_update(self):
         """Schedule the next time marker update"""
@@ -859,6 +940,10 @@ class TimeBlocksSection(tk.Frame):
 
     def _remove_task_from_canvas(self, task: Task):
         """Remove task items from canvas"""
+        self._task_labels.pop(task.text_id, None)
+        if self._hover_task is task:
+            TooltipManager.hide_tooltip(self.canvases["task"])
+            self._hover_task = None
         for item_id in [task.box_id, task.text_id]:
             if item_id:
                 self.canvases["task"].delete(item_id)
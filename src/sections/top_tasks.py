@@ -2,12 +2,25 @@ import tkinter as tk
 from tkinter import Toplevel
 
 from src.data_manager import DataManager
-from src.models.data_classes import Colors, Dimensions, TopTask
+from src.models.data_classes import (
+    Colors,
+    Dimensions,
+    TopTask,
+    is_placeholder_section,
+    placeholder_top_tasks,
+)
+from src.utils.profiling import profiled
+from src.utils.text_layout import TextLayout
 from src.utils.tooltip import TooltipManager
 
 
 class TopTasksSection(tk.Frame):
-    def __init__(self, parent, current_date):
+    # Task label width in characters, as used for the Label's width option
+    LABEL_WIDTH_CHARS = 29
+    # Priority rows shown; their widgets are created once and reused per date
+    ROWS = 3
+
+    def __init__(self, parent, current_date, data_manager=None):
         super().__init__(parent)
 
         # Store reference to main window and ensure it's the root window
@@ -22,11 +35,21 @@ class TopTasksSection(tk.Frame):
         self.colors = Colors()
         self.configure(bg=self.colors.PRIORITY_BOX_BG)
         self.current_date = current_date
-        self.data_manager = DataManager()
+        self.data_manager = data_manager or DataManager()
+        self.text_layout = TextLayout.shared()
+        self.label_font = ("Arial", 11)
+        # Label widths in characters are measured with the "0" glyph
+        self.label_max_width = (
+            self.text_layout.measure(self.label_font, "0") * self.LABEL_WIDTH_CHARS
+        )
 
-        self.checkboxes = {}
-        self.task_frames = []
         self.state = []
+        # Row widgets by row index
+        self.row_frames = []
+        self.checkbox_vars = []
+        self.labels = []
+        # Full text of truncated labels for their tooltip, None if it fits
+        self.tooltip_texts = []
 
         self.tasks_container = tk.Frame(self, bg=self.colors.PRIORITY_BOX_BG)
 
@@ -52,40 +75,35 @@ class TopTasksSection(tk.Frame):
         # Pack the tasks container
         self.tasks_container.pack(fill="both", expand=True, padx=5)
 
-    def load_tasks(self, date):
-        """Load priority tasks for a specific date"""
-        self.current_date = date
+        for index in range(self.ROWS):
+            self._create_row(index)
 
-        # Clear existing task frames
-        for frame in self.task_frames:
-            frame.destroy()
-        self.task_frames = []
-        self.checkboxes = {}
+    @profiled("top_tasks.load_tasks")
+    def load_tasks(self, date, top_tasks=None):
+        """Load priority tasks for a specific date, or show the given TopTasks"""
+        self.current_date = date
 
         # Load tasks from data manager
-        tasks = self.data_manager.load_top_tasks(date)
-        if not tasks:
-            # Initialize with default empty tasks
-            tasks = [
-                {"text": "Click to add priority task 1", "completed": False},
-                {"text": "Click to add priority task 2", "completed": False},
-                {"text": "Click to add priority task 3", "completed": False},
-            ]
-            self.data_manager.save_top_tasks(date, tasks)
-
-        # Create task frames
-        self.state = [TopTask(**task) for task in tasks]
-        for i, task in enumerate(self.state):
-            frame = self._create_task_frame(i, task)
-            if frame:
-                frame.pack(in_=self.tasks_container, fill="x", pady=1)
-                self.task_frames.append(frame)
-
-    def _create_task_frame(self, index, task):
-        """Create a frame for a single task"""
-        if not task:
-            return None
-
+        if top_tasks is None:
+            tasks = self.data_manager.load_top_tasks(date)
+            top_tasks = [TopTask(**task) for task in tasks]
+        if not top_tasks:
+            # Placeholders live in the view only until the first edit saves them
+            top_tasks = placeholder_top_tasks()
+
+        # Fill the existing rows; unused ones are hidden, never destroyed
+        self.state = top_tasks
+        for index, frame in enumerate(self.row_frames):
+            if index < len(self.state):
+                self.checkbox_vars[index].set(self.state[index].completed)
+                self._update_label(index)
+                if not frame.winfo_manager():
+                    frame.pack(in_=self.tasks_container, fill="x", pady=1)
+            else:
+                frame.pack_forget()
+
+    def _create_row(self, index):
+        """Create the widgets of one priority row"""
         # Main container frame
         frame = tk.Frame(
             self.tasks_container, bg=self.colors.PRIORITY_BOX_BG, padx=15, pady=2
@@ -112,76 +130,65 @@ class TopTasksSection(tk.Frame):
         content_frame.pack(side="left", fill="both", expand=True, pady=6)
 
         # Create checkbox
-        checkbox_var = tk.BooleanVar(value=task.completed)
-        self.checkboxes[index] = checkbox_var
+        checkbox_var = tk.BooleanVar(value=False)
 
         checkbox_frame = tk.Frame(content_frame, bg=self.colors.PRIORITY_TASK_BG)
         checkbox_frame.pack(side="left", padx=15)
 
-        cb = tk.Checkbutton(
+        tk.Checkbutton(
             checkbox_frame,
             bg=self.colors.PRIORITY_TASK_BG,
             variable=checkbox_var,
             command=lambda i=index: self._toggle_task(i),
-        )
-        cb.pack()
-
-        if task.completed:
-            cb.select()
-        else:
-            cb.deselect()
+        ).pack()
 
         # Task text label
-        label = self._create_task_label(content_frame, task, index)
+        label = tk.Label(
+            content_frame,
+            font=self.label_font,
+            bg=self.colors.PRIORITY_TASK_BG,
+            cursor="hand2",
+            anchor="w",
+            width=self.LABEL_WIDTH_CHARS,
+        )
         label.pack(side="left", fill="x", expand=True, padx=(0, 15))
 
-        return frame
+        # Bound once; the tooltip text follows whatever the row shows
+        label.bind("<Button-1>", lambda e, i=index: self._edit_task(i))
+        label.bind("<Enter>", lambda e, i=index: self._show_tooltip(i))
+        label.bind("<Leave>", lambda e: TooltipManager.hide_tooltip(label))
+
+        self.row_frames.append(frame)
+        self.checkbox_vars.append(checkbox_var)
+        self.labels.append(label)
+        self.tooltip_texts.append(None)
 
-    def _create_task_label(self, parent, task, index):
-        """Create the label for a task"""
+    def _update_label(self, index):
+        """Show a task's text and completion style in its row"""
+        task = self.state[index]
+        label = self.labels[index]
         truncated_text = self._truncate_text(task.text)
 
-        label = tk.Label(
-            parent,
+        label.config(
             text=truncated_text,
             font=("Arial", 11, "overstrike" if task.completed else "normal"),
-            bg=self.colors.PRIORITY_TASK_BG,
             fg=self.colors.PRIORITY_TASK_COMPLETED
             if task.completed
             else self.colors.PRIORITY_TASK_TEXT,
-            cursor="hand2",
-            anchor="w",
-            width=29,
         )
 
-        # Bind click event for editing
-        label.bind("<Button-1>", lambda e, i=index: self._edit_task(i))
-
-        # Set up tooltip if needed
-        self._setup_tooltip(label, task.text)
-
-        return label
-
-    def _setup_tooltip(self, label, full_text):
-        """Set up tooltip for a label if text is too long"""
-        if hasattr(label, "tooltip") and label.tooltip is not None:
-            try:
-                label.tooltip.destroy()
-                label.tooltip = None
-            except tk.TclError:
-                pass
+        # Only truncated text gets a tooltip
+        self.tooltip_texts[index] = task.text if truncated_text != task.text else None
+        TooltipManager.hide_tooltip(label)
 
-        label.unbind("<Enter>")
-        label.unbind("<Leave>")
+    def _show_tooltip(self, index):
+        full_text = self.tooltip_texts[index]
+        if full_text is not None:
+            TooltipManager.show_tooltip(self.labels[index], full_text, "Arial", 11)
 
-        if len(full_text) > 29:
-            TooltipManager.setup_tooltip(label, full_text, "Arial", 11)
-
-    def _truncate_text(self, text, max_length=29):
-        """Truncate text if it's too long"""
-        if len(text) > max_length:
-            return text[: max_length - 3] + "..."
-        return text
+    def _truncate_text(self, text):
+        """Truncate text to the pixel width of the task label"""
+        return self.text_layout.truncate(self.label_font, text, self.label_max_width)
 
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts for editing tasks"""
@@ -202,33 +209,19 @@ class TopTasksSection(tk.Frame):
 
     def _handle_task_shortcut(self, index):
         """Handle keyboard shortcut for editing a specific task"""
-        if index < len(self.state):
+        if index < min(len(self.state), self.ROWS):
             self._edit_task(index)
         return "break"
 
+    @profiled("top_tasks.toggle_task")
     def _toggle_task(self, index):
         """Handle task completion toggle"""
         if index >= len(self.state):
             return
 
-        task = self.state[index]
-        checkbox_var = self.checkboxes.get(index)
-        if checkbox_var is None:
-            return
-
         # Update completion status
-        task.completed = checkbox_var.get()
-
-        # Update UI
-        content_frame = self.task_frames[index].winfo_children()[1]
-        label = content_frame.winfo_children()[1]
-
-        label.config(
-            fg=self.colors.PRIORITY_TASK_COMPLETED
-            if task.completed
-            else self.colors.PRIORITY_TASK_TEXT,
-            font=("Arial", 11, "overstrike" if task.completed else "normal"),
-        )
+        self.state[index].completed = self.checkbox_vars[index].get()
+        self._update_label(index)
 
         # Save changes
         self._save_tasks()
@@ -271,15 +264,7 @@ class TopTasksSection(tk.Frame):
             return
 
         self.state[index].text = new_text
-        content_frame = self.task_frames[index].winfo_children()[1]
-        label = content_frame.winfo_children()[1]
-
-        # Update label with new text
-        truncated_text = self._truncate_text(new_text)
-        label.config(text=truncated_text)
-
-        # Update tooltip if needed
-        self._setup_tooltip(label, new_text)
+        self._update_label(index)
 
         # Save changes
         self._save_tasks()
@@ -290,4 +275,8 @@ class TopTasksSection(tk.Frame):
         tasks_data = [
             {"text": task.text, "completed": task.completed} for task in self.state
         ]
-        self.data_manager.save_top_tasks(self.current_date, tasks_data)
+        if is_placeholder_section(tasks_data):
+            # Back to untouched placeholders, nothing worth keeping
+            self.data_manager.delete_top_tasks(self.current_date)
+        else:
+            self.data_manager.save_top_tasks(self.current_date, tasks_data)
@@ -0,0 +1,70 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# A day record maps section names ("top_tasks", "tasks") to lists of items
+DayRecord = Dict[str, List[Dict[str, Any]]]
+
+
+class StorageBackend(ABC):
+    """Interface for persisting per-date sections of the tasks document"""
+
+    def __init__(self):
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @abstractmethod
+    def load_day(self, date_str: str) -> DayRecord:
+        """Return all stored sections for one date"""
+
+    @abstractmethod
+    def save_section(
+        self, date_str: str, section_name: str, data: List[Dict[str, Any]]
+    ) -> None:
+        """Replace one section of one date"""
+
+    def save_days(self, days: Iterator[Tuple[str, DayRecord]]) -> None:
+        """Write many days at once, used for bulk imports"""
+        for date_str, record in days:
+            for section_name, data in record.items():
+                self.save_section(date_str, section_name, data)
+
+    @abstractmethod
+    def delete_sections(self, keys: Iterable[Tuple[str, str]]) -> None:
+        """Remove (date, section) pairs, dropping dates left without sections"""
+
+    @abstractmethod
+    def iter_days(self) -> Iterator[Tuple[str, DayRecord]]:
+        """Yield (date, record) pairs for every stored date in date order"""
+
+    def data_signature(self) -> Any:
+        """JSON value that changes with the stored data, even when it is edited
+        outside the app, or None if the backend cannot tell"""
+        return None
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return read cache hit/miss counters"""
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
+
+    def close(self) -> None:
+        """Release any open resources"""
+
+
+def drop_sections(document: Dict[str, DayRecord], keys: Iterable[Tuple[str, str]]):
+    """Remove (date, section) pairs from a document and dates left empty"""
+    for date_str, section_name in keys:
+        record = document.get(date_str)
+        if record is None:
+            continue
+        record.pop(section_name, None)
+        if not record:
+            del document[date_str]
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """Identify a file version on disk by mtime, size and inode"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
@@ -0,0 +1,48 @@
+from typing import Tuple
+from urllib.parse import parse_qs
+
+from src.storage.base import StorageBackend
+from src.storage.journal import JournalStorage
+from src.storage.json_file import JsonFileStorage
+from src.storage.sharded import ShardedStorage
+from src.storage.sqlite import SqliteStorage
+
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+
+def open_storage(location: str, compact_threshold=1024 * 1024) -> StorageBackend:
+    """Open the storage backend for a location.
+
+    The backend is picked from the URI scheme (``json://``, ``journal://``,
+    ``sqlite://``, ``shards://``) or, for plain paths, from the file extension.
+    ``shards://data?legacy=tasks.json`` keeps reading an old single-file
+    document for months that have not been written as shards yet.
+    """
+    scheme, path = parse_location(location)
+    if scheme == "sqlite":
+        return SqliteStorage(path)
+    if scheme == "journal":
+        return JournalStorage(path, compact_threshold)
+    if scheme == "json":
+        return JsonFileStorage(path)
+    if scheme == "shards":
+        root, _, query = path.partition("?")
+        legacy = parse_qs(query).get("legacy", [None])[0]
+        return ShardedStorage(root, legacy_file=legacy)
+    raise ValueError(f"Unknown storage scheme: {scheme}")
+
+
+def parse_location(location: str) -> Tuple[str, str]:
+    """Split a storage location into (scheme, path)"""
+    if "://" in location:
+        scheme, path = location.split("://", 1)
+        return scheme.lower(), path
+    if location.lower().endswith(SQLITE_EXTENSIONS):
+        return "sqlite", location
+    return "json", location
+
+
+def sidecar_path(location: str, suffix: str) -> str:
+    """Path of a derived file kept next to a location's data, e.g. an index"""
+    _, path = parse_location(location)
+    return path.partition("?")[0].rstrip("/\\") + suffix
@@ -0,0 +1,224 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.storage.base import (
+    DayRecord,
+    StorageBackend,
+    drop_sections,
+    file_signature,
+)
+from src.utils.profiling import profiler
+
+
+class JournalStorage(StorageBackend):
+    """Snapshot plus append-only log storage for the tasks document.
+
+    The snapshot is a regular ``tasks.json`` file, so existing data files are
+    picked up as-is. Each save appends one compact ``(date, section, payload)``
+    record to ``<snapshot>.journal``, and ``save_days`` appends one record
+    for the whole batch. Once the log grows past ``compact_threshold`` bytes
+    it is rotated and folded back into the snapshot on a background thread.
+    """
+
+    def __init__(self, filename="tasks.json", compact_threshold=1024 * 1024):
+        super().__init__()
+        self.filename = filename
+        self.log_filename = f"{filename}.journal"
+        self.rotated_log_filename = f"{filename}.journal.old"
+        self.compact_threshold = compact_threshold
+
+        self._lock = threading.RLock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._signature: Optional[Tuple] = None
+        self._compaction_thread: Optional[threading.Thread] = None
+
+    def load(self) -> Dict[str, Any]:
+        """Return the current document, rebuilding it if files changed on disk"""
+        with self._lock:
+            if self._state is None or self._signature != self._files_signature():
+                self.cache_misses += 1
+                self._rebuild()
+            else:
+                self.cache_hits += 1
+            return self._state
+
+    def load_day(self, date_str: str) -> DayRecord:
+        return self.load().get(date_str, {})
+
+    def save_section(
+        self, date_str: str, section_name: str, data: List[Dict[str, Any]]
+    ) -> None:
+        """Persist one section of one date by appending it to the log"""
+        record = {"d": date_str, "s": section_name, "p": data}
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+
+        with self._lock:
+            state = self.load()
+            self._append(line)
+            state.setdefault(date_str, {})[section_name] = data
+            self._signature = self._files_signature()
+            log_size = self._signature[2][1] if self._signature[2] else 0
+
+        if log_size >= self.compact_threshold:
+            self.compact(background=True)
+
+    def save_days(self, days: Iterator[Tuple[str, DayRecord]]) -> None:
+        """Persist many days as one log record, so they apply all or nothing"""
+        batch: Dict[str, DayRecord] = {}
+        for date_str, record in days:
+            batch.setdefault(date_str, {}).update(record)
+        line = json.dumps({"b": batch}, separators=(",", ":")) + "\n"
+
+        with self._lock:
+            state = self.load()
+            self._append(line)
+            for date_str, record in batch.items():
+                state.setdefault(date_str, {}).update(record)
+            self._signature = self._files_signature()
+            log_size = self._signature[2][1] if self._signature[2] else 0
+
+        if log_size >= self.compact_threshold:
+            self.compact(background=True)
+
+    def delete_sections(self, keys: Iterable[Tuple[str, str]]) -> None:
+        """Persist removed sections as one log record"""
+        keys = [list(key) for key in keys]
+        line = json.dumps({"r": keys}, separators=(",", ":")) + "\n"
+
+        with self._lock:
+            state = self.load()
+            self._append(line)
+            drop_sections(state, keys)
+            self._signature = self._files_signature()
+
+    def data_signature(self):
+        # A running compaction is about to replace the files, wait for it
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+        return self._files_signature()
+
+    def iter_days(self) -> Iterator[Tuple[str, DayRecord]]:
+        with self._lock:
+            state = self.load()
+            days = [(date_str, state[date_str]) for date_str in sorted(state)]
+        yield from days
+
+    def compact(self, background=False):
+        """Fold the log into the snapshot file"""
+        with self._lock:
+            if self._compaction_thread and self._compaction_thread.is_alive():
+                return
+            state = self.load()
+            if not os.path.exists(self.log_filename) and not os.path.exists(
+                self.rotated_log_filename
+            ):
+                return
+            self._rotate_log()
+            # Saves replace whole section lists, so copying two levels is enough
+            snapshot = {date: dict(sections) for date, sections in state.items()}
+
+            if not background:
+                self._write_snapshot(snapshot)
+                return
+
+            self._compaction_thread = threading.Thread(
+                target=self._write_snapshot,
+                args=(snapshot,),
+                name="journal-compaction",
+                daemon=True,
+            )
+            self._compaction_thread.start()
+
+    def close(self) -> None:
+        """Wait for a running compaction to finish"""
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join()
+
+    def _append(self, line: str):
+        """Append a record, first cutting off a torn one left by a crash"""
+        with open(self.log_filename, "ab+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    # Records written after it would otherwise share its line
+                    f.seek(0)
+                    f.truncate(f.read().rfind(b"\n") + 1)
+            f.write(line.encode("utf-8"))
+
+    def _rotate_log(self):
+        """Move the active log aside so new saves start a fresh one"""
+        if not os.path.exists(self.log_filename):
+            return
+        if os.path.exists(self.rotated_log_filename):
+            # A previous compaction did not finish; keep both logs in order
+            with open(self.log_filename, "rb") as src, open(
+                self.rotated_log_filename, "ab+"
+            ) as dst:
+                size = dst.seek(0, os.SEEK_END)
+                if size:
+                    dst.seek(size - 1)
+                    if dst.read(1) != b"\n":
+                        dst.write(b"\n")  # Keep a torn record on its own line
+                dst.write(src.read())
+            os.remove(self.log_filename)
+        else:
+            os.replace(self.log_filename, self.rotated_log_filename)
+        self._signature = self._files_signature()
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]):
+        temp_file = f"{self.filename}.tmp"
+        with open(temp_file, "w") as f, profiler.timer("json.serialize"):
+            json.dump(snapshot, f, indent=4)
+
+        with self._lock:
+            os.replace(temp_file, self.filename)
+            # Replaying the rotated log again would be harmless, but it is now
+            # fully contained in the snapshot
+            if os.path.exists(self.rotated_log_filename):
+                os.remove(self.rotated_log_filename)
+            self._signature = self._files_signature()
+
+    def _rebuild(self):
+        """Rebuild the document from the snapshot and the logs"""
+        try:
+            with open(self.filename, "r") as f, profiler.timer("json.parse"):
+                state = json.load(f)
+        except FileNotFoundError:
+            state = {}
+
+        for log_file in (self.rotated_log_filename, self.log_filename):
+            self._replay(log_file, state)
+
+        self._state = state
+        self._signature = self._files_signature()
+
+    @staticmethod
+    def _replay(log_file: str, state: Dict[str, Any]):
+        try:
+            with open(log_file, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write from an interrupted save, later ones still apply
+                        continue
+                    if "r" in record:
+                        drop_sections(state, record["r"])
+                    elif "b" in record:
+                        for date_str, day in record["b"].items():
+                            state.setdefault(date_str, {}).update(day)
+                    else:
+                        state.setdefault(record["d"], {})[record["s"]] = record["p"]
+        except FileNotFoundError:
+            pass
+
+    def _files_signature(self) -> Tuple:
+        return tuple(
+            file_signature(path)
+            for path in (self.filename, self.rotated_log_filename, self.log_filename)
+        )
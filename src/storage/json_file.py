@@ -0,0 +1,119 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.storage.base import (
+    DayRecord,
+    StorageBackend,
+    drop_sections,
+    file_signature,
+)
+from src.storage.offset_index import OffsetIndex
+from src.utils.profiling import profiler
+
+
+class JsonFileStorage(StorageBackend):
+    """Single JSON document keyed by date, rewritten in full on each save"""
+
+    def __init__(self, filename="tasks.json", offset_index=True):
+        super().__init__()
+        self.filename = filename
+        # Reads single days by byte range until the whole document is needed
+        self.offset_index = OffsetIndex(filename) if offset_index else None
+        # Days read from disk by byte range, also counted as cache misses
+        self.offset_reads = 0
+
+        # Parsed document cache, invalidated when the file changes on disk
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_signature: Optional[Tuple[int, int, int]] = None
+
+        # _lock guards the cache, _write_lock keeps whole-file writes in order.
+        # Serialization runs outside _lock so readers are not blocked by it.
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+
+    def load_day(self, date_str: str) -> DayRecord:
+        with self._lock:
+            signature = file_signature(self.filename)
+            if self._cache is not None and signature == self._cache_signature:
+                self.cache_hits += 1
+                return self._cache.get(date_str, {})
+            if self.offset_index is not None:
+                record = self.offset_index.load_day(date_str)
+                if record is not None:
+                    self.cache_misses += 1
+                    self.offset_reads += 1
+                    return record
+            return self._load_data().get(date_str, {})
+
+    def save_section(
+        self, date_str: str, section_name: str, data: List[Dict[str, Any]]
+    ) -> None:
+        self.save_days(iter([(date_str, {section_name: data})]))
+
+    def save_days(self, days: Iterator[Tuple[str, DayRecord]]) -> None:
+        with self._write_lock:
+            with self._lock:
+                all_data = self._load_data()
+                for date_str, record in days:
+                    all_data.setdefault(date_str, {}).update(record)
+                # Sections are replaced rather than mutated, two levels suffice
+                snapshot = {date: dict(record) for date, record in all_data.items()}
+            self._write_data(snapshot)
+
+    def delete_sections(self, keys: Iterable[Tuple[str, str]]) -> None:
+        with self._write_lock:
+            with self._lock:
+                all_data = self._load_data()
+                drop_sections(all_data, keys)
+                snapshot = {date: dict(record) for date, record in all_data.items()}
+            self._write_data(snapshot)
+
+    def _write_data(self, all_data: Dict[str, Any]):
+        temp_file = f"{self.filename}.tmp"
+        try:
+            with open(temp_file, "w") as f, profiler.timer("json.serialize"):
+                json.dump(all_data, f, indent=4)
+            with self._lock:
+                os.replace(temp_file, self.filename)
+                self._cache_signature = file_signature(self.filename)
+        except OSError:
+            # The cached document no longer matches the file, re-read next time
+            self.invalidate_cache()
+            raise
+
+    def cache_stats(self) -> Dict[str, int]:
+        return {**super().cache_stats(), "offset_reads": self.offset_reads}
+
+    def data_signature(self):
+        return file_signature(self.filename)
+
+    def iter_days(self) -> Iterator[Tuple[str, DayRecord]]:
+        with self._lock:
+            data = self._load_data()
+            days = [(date_str, data[date_str]) for date_str in sorted(data)]
+        yield from days
+
+    def invalidate_cache(self):
+        """Drop the cached document so the next load re-reads the file"""
+        with self._lock:
+            self._cache = None
+            self._cache_signature = None
+
+    def _load_data(self) -> Dict[str, Any]:
+        signature = file_signature(self.filename)
+        if self._cache is not None and signature == self._cache_signature:
+            self.cache_hits += 1
+            return self._cache
+
+        self.cache_misses += 1
+        try:
+            with open(self.filename, "r") as f, profiler.timer("json.parse"):
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+
+        self._cache = data
+        self._cache_signature = signature
+        return data
@@ -0,0 +1,25 @@
+from src.storage.base import StorageBackend
+from src.storage.factory import open_storage
+
+
+def copy_storage(source: StorageBackend, destination: StorageBackend) -> int:
+    """Copy every stored date from one backend to another, returns the day count"""
+    days = list(source.iter_days())
+    destination.save_days(iter(days))
+    return len(days)
+
+
+def migrate(source: str, destination: str) -> int:
+    """Copy all data between two storage locations, e.g. tasks.json -> tasks.db"""
+    source_storage = open_storage(source)
+    target_storage = open_storage(destination)
+    try:
+        return copy_storage(source_storage, target_storage)
+    finally:
+        source_storage.close()
+        target_storage.close()
+
+
+def import_json_file(json_path: str, destination: str) -> int:
+    """One-shot import of an existing tasks.json file into another location"""
+    return migrate(f"json://{json_path}", destination)
@@ -0,0 +1,116 @@
+import json
+import mmap
+import os
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+from src.storage.base import DayRecord, file_signature
+from src.utils.profiling import profiler
+
+# A top-level date key as json.dump(..., indent=4) writes it. Strings cannot
+# contain raw newlines, so a newline and exactly four spaces before a quote
+# only occur in front of keys of the outermost object.
+DAY_KEY = re.compile(rb'\n {4}"(\d{4}-\d{2}-\d{2})": ')
+
+Offsets = Dict[str, Tuple[int, int]]
+
+
+def scan_offsets(buffer) -> Optional[Offsets]:
+    """Byte range of each day's value, or None if the layout is not ours"""
+    if buffer[:1] != b"{":
+        return None
+    matches = list(DAY_KEY.finditer(buffer))
+    if not matches and buffer[:2].rstrip() != b"{}":
+        return None
+
+    offsets = {}
+    for match, following in zip(matches, matches[1:] + [None]):
+        end = following.start() if following else len(buffer)
+        offsets[match.group(1).decode("ascii")] = (match.end(), end)
+    return offsets
+
+
+class OffsetIndex:
+    """Reads single days from a JSON document without parsing all of it.
+
+    The byte range of every top-level date is kept in a sidecar file
+    together with the document's signature; when the document changes,
+    including edits made outside the app, the ranges are scanned again.
+    Days are sliced out through mmap and decoded on their own.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.index_filename = f"{filename}.offsets.json"
+        self._offsets: Optional[Offsets] = None
+        self._signature = None
+        self._lock = threading.Lock()
+        self._decoder = json.JSONDecoder()
+        self.rebuilds = 0
+
+    def load_day(self, date_str: str) -> Optional[DayRecord]:
+        """The day's record, or None if the file cannot be read this way"""
+        with self._lock:
+            signature = file_signature(self.filename)
+            if signature is None:
+                return {}
+            if signature != self._signature and not self._load_index(signature):
+                return None
+
+            span = self._offsets.get(date_str)
+            if span is None:
+                return {}
+            start, end = span
+            with open(self.filename, "rb") as f:
+                # Mapped per read so the file can still be replaced on Windows
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    text = buffer[start:end].decode("utf-8")
+            if file_signature(self.filename) != signature:
+                return None  # Replaced while reading, let the caller re-read
+            with profiler.timer("json.parse_day"):
+                return self._decoder.raw_decode(text)[0]
+
+    def invalidate(self):
+        with self._lock:
+            self._offsets = None
+            self._signature = None
+
+    def _load_index(self, signature) -> bool:
+        try:
+            with open(self.index_filename, "r") as f:
+                stored = json.load(f)
+            if tuple(stored["signature"]) == signature:
+                self._offsets = {
+                    date_str: tuple(span)
+                    for date_str, span in stored["offsets"].items()
+                }
+                self._signature = signature
+                return True
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return self._rebuild(signature)
+
+    def _rebuild(self, signature) -> bool:
+        self.rebuilds += 1
+        try:
+            with open(self.filename, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    offsets = scan_offsets(buffer)
+        except OSError:
+            return False
+        if offsets is None or file_signature(self.filename) != signature:
+            return False
+
+        self._offsets = offsets
+        self._signature = signature
+        try:
+            temp_file = f"{self.index_filename}.tmp"
+            with open(temp_file, "w") as f:
+                json.dump({"signature": signature, "offsets": offsets}, f)
+            os.replace(temp_file, self.index_filename)
+        except OSError:
+            pass  # The index is only an optimization
+        return True
@@ -0,0 +1,115 @@
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.models.data_classes import PLACEHOLDER_TEXTS
+from src.storage.sidecar import SidecarIndex
+
+Summary = Dict[str, int]
+
+# Counters kept per day and summed per week and month
+FIELDS = ("blocks", "minutes", "top_set", "top_done", "days_all_done")
+
+
+def empty_summary() -> Summary:
+    return dict.fromkeys(FIELDS, 0)
+
+
+def week_start(date_str: str) -> str:
+    day = date.fromisoformat(date_str)
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+class RollupStore(SidecarIndex):
+    """Per-day and per-week totals of planned time and priority completion.
+
+    Kept up to date from each save, so stats views never scan the stored
+    history. Only the per-day table is persisted; weeks are summed on load.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path, source, tracker=None):
+        super().__init__(path, source, tracker)
+        self._days: Dict[str, Summary] = {}
+        self._weeks: Dict[str, Summary] = {}
+
+    def day(self, date_str: str) -> Optional[Summary]:
+        with self._lock:
+            self._ensure_loaded()
+            summary = self._days.get(date_str)
+            return dict(summary) if summary else None
+
+    def days_between(self, first: date, last: date) -> Dict[str, Summary]:
+        """Summaries of the stored days from first to last, inclusive"""
+        with self._lock:
+            self._ensure_loaded()
+            days = {}
+            day = first
+            while day <= last:
+                summary = self._days.get(day.isoformat())
+                if summary:
+                    days[day.isoformat()] = dict(summary)
+                day += timedelta(days=1)
+            return days
+
+    def weeks(self, last: Optional[int] = None) -> List[Tuple[str, Summary]]:
+        """(Monday, totals) of each week with data, oldest first"""
+        with self._lock:
+            self._ensure_loaded()
+            weeks = sorted(self._weeks.items())
+            return [(week, dict(totals)) for week, totals in weeks[-(last or 0) :]]
+
+    def months(self, last: Optional[int] = None) -> List[Tuple[str, Summary]]:
+        """("YYYY-MM", totals) of each month with data, oldest first"""
+        with self._lock:
+            self._ensure_loaded()
+            months: Dict[str, Summary] = {}
+            for date_str, summary in self._days.items():
+                totals = months.setdefault(date_str[:7], empty_summary())
+                for field in FIELDS:
+                    totals[field] += summary[field]
+            return sorted(months.items())[-(last or 0) :]
+
+    def _reset(self):
+        self._days = {}
+        self._weeks = {}
+
+    def _dump(self):
+        return self._days
+
+    def _restore(self, data):
+        self._days = data
+        for date_str, summary in self._days.items():
+            self._add_to_week(date_str, summary, 1)
+
+    def _apply(self, date_str: str, section_name: str, data: list):
+        summary = self._days.get(date_str) or empty_summary()
+        self._add_to_week(date_str, summary, -1)
+
+        summary = dict(summary)
+        if section_name == "tasks":
+            summary["blocks"] = len(data)
+            summary["minutes"] = sum(
+                round((block["end_time"] - block["start_time"]) * 60) for block in data
+            )
+        elif section_name == "top_tasks":
+            tasks = [task for task in data if task["text"] not in PLACEHOLDER_TEXTS]
+            summary["top_set"] = len(tasks)
+            summary["top_done"] = sum(1 for task in tasks if task.get("completed"))
+        summary["days_all_done"] = int(
+            summary["top_set"] > 0 and summary["top_done"] == summary["top_set"]
+        )
+
+        if any(summary.values()):
+            self._days[date_str] = summary
+            self._add_to_week(date_str, summary, 1)
+        else:
+            self._days.pop(date_str, None)
+
+    def _add_to_week(self, date_str: str, summary: Summary, sign: int):
+        week = week_start(date_str)
+        totals = self._weeks.setdefault(week, empty_summary())
+        for field in FIELDS:
+            totals[field] += sign * summary[field]
+        if not any(totals.values()):
+            del self._weeks[week]
@@ -0,0 +1,147 @@
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.models.data_classes import PLACEHOLDER_TEXTS
+from src.storage.base import DayRecord
+from src.storage.sidecar import SECTIONS, SidecarIndex
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex(SidecarIndex):
+    """Inverted index from lowercase word to the dates it appears on.
+
+    Covers block names and priority texts. Queries match every term as a
+    word prefix, so "deep wo" finds days with "Deep work". The postings are
+    persisted with the tokens of each day's sections, which are needed to
+    update them; the texts shown with results are read via ``load_day``.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path, source, load_day, tracker=None):
+        super().__init__(path, source, tracker)
+        self._load_day = load_day
+        # date -> section -> sorted unique tokens of its texts
+        self._days: Dict[str, Dict[str, List[str]]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._sorted_tokens: Optional[List[str]] = None
+
+    def search(self, query: str, limit=200) -> Tuple[int, List[Tuple[str, List[str]]]]:
+        """Number of days matching all terms, and (date, matching texts) of
+        the newest ``limit`` of them"""
+        terms = tokenize(query)
+        if not terms:
+            return 0, []
+
+        with self._lock:
+            self._ensure_loaded()
+            dates: Optional[Set[str]] = None
+            matched_tokens: Set[str] = set()
+            for term in terms:
+                tokens = self._tokens_with_prefix(term)
+                matched_tokens.update(tokens)
+                term_dates = set().union(*(self._postings[t] for t in tokens))
+                dates = term_dates if dates is None else dates & term_dates
+                if not dates:
+                    return 0, []
+            dates_shown = sorted(dates, reverse=True)[:limit]
+
+        results = []
+        for date_str in dates_shown:
+            record = self._load_day(date_str)
+            texts = dict.fromkeys(
+                text
+                for text in section_texts(record)
+                if matched_tokens.intersection(tokenize(text))
+            )
+            results.append((date_str, list(texts)))
+        return len(dates), results
+
+    def _tokens_with_prefix(self, prefix: str) -> List[str]:
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        tokens = self._sorted_tokens
+        index = bisect_left(tokens, prefix)
+        found = []
+        while index < len(tokens) and tokens[index].startswith(prefix):
+            found.append(tokens[index])
+            index += 1
+        return found
+
+    def _day_tokens(self, date_str: str) -> Set[str]:
+        return {
+            token
+            for tokens in self._days.get(date_str, {}).values()
+            for token in tokens
+        }
+
+    def _reset(self):
+        self._days = {}
+        self._postings = {}
+        self._sorted_tokens = None
+
+    def _dump(self):
+        return {
+            "postings": {
+                token: sorted(dates) for token, dates in self._postings.items()
+            },
+            "days": self._days,
+        }
+
+    def _restore(self, data):
+        self._postings = {
+            token: set(dates) for token, dates in data["postings"].items()
+        }
+        self._days = data["days"]
+
+    def _apply(self, date_str: str, section_name: str, data: list):
+        tokens = sorted(
+            {
+                token
+                for text in indexed_texts(section_name, data)
+                for token in tokenize(text)
+            }
+        )
+
+        before = self._day_tokens(date_str)
+        sections = self._days.setdefault(date_str, {})
+        if tokens:
+            sections[section_name] = tokens
+        else:
+            sections.pop(section_name, None)
+            if not sections:
+                del self._days[date_str]
+        after = self._day_tokens(date_str)
+
+        for token in before - after:
+            dates = self._postings[token]
+            dates.discard(date_str)
+            if not dates:
+                del self._postings[token]
+                self._sorted_tokens = None
+        for token in after - before:
+            if token not in self._postings:
+                self._postings[token] = set()
+                self._sorted_tokens = None
+            self._postings[token].add(date_str)
+
+
+def indexed_texts(section_name: str, data: list) -> List[str]:
+    """Texts of a section that are searchable, skipping placeholders"""
+    key = "name" if section_name == "tasks" else "text"
+    return [item[key] for item in data if item.get(key) not in PLACEHOLDER_TEXTS]
+
+
+def section_texts(record: DayRecord) -> List[str]:
+    """Searchable texts of every section of a day"""
+    return [
+        text
+        for section_name in SECTIONS
+        for text in indexed_texts(section_name, record.get(section_name, []))
+    ]
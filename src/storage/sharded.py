@@ -0,0 +1,149 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.storage.base import DayRecord, StorageBackend, file_signature
+from src.storage.json_file import JsonFileStorage
+from src.utils.profiling import profiler
+
+
+class ShardedStorage(StorageBackend):
+    """One JSON file per month under ``root`` (e.g. ``data/2026/10.json``).
+
+    Saving a day rewrites only that month's shard, so the cost does not grow
+    with the length of the history. An optional ``legacy_file`` in the old
+    single-document format is still read for dates that have no shard yet;
+    the first save to such a date copies it over into its month.
+    """
+
+    def __init__(self, root="data", legacy_file: Optional[str] = None):
+        super().__init__()
+        self.root = root
+        self.legacy = JsonFileStorage(legacy_file) if legacy_file else None
+
+        self._lock = threading.RLock()
+        # month key ("2026-10") -> (file signature, parsed shard)
+        self._shards: Dict[str, Tuple[Optional[Tuple[int, int, int]], Dict]] = {}
+
+    def load_day(self, date_str: str) -> DayRecord:
+        with self._lock:
+            shard = self._load_shard(date_str[:7])
+            if date_str in shard:
+                return shard[date_str]
+        if self.legacy is not None:
+            return self.legacy.load_day(date_str)
+        return {}
+
+    def save_section(
+        self, date_str: str, section_name: str, data: List[Dict[str, Any]]
+    ) -> None:
+        self.save_days(iter([(date_str, {section_name: data})]))
+
+    def save_days(self, days: Iterator[Tuple[str, DayRecord]]) -> None:
+        by_month: Dict[str, List[Tuple[str, DayRecord]]] = {}
+        for date_str, record in days:
+            by_month.setdefault(date_str[:7], []).append((date_str, record))
+
+        with self._lock:
+            for month, month_days in by_month.items():
+                shard = self._load_shard(month)
+                for date_str, record in month_days:
+                    if date_str not in shard and self.legacy is not None:
+                        # Carry over the other sections of a not yet migrated day
+                        shard[date_str] = dict(self.legacy.load_day(date_str))
+                    shard.setdefault(date_str, {}).update(record)
+                self._write_shard(month, shard)
+
+    def delete_sections(self, keys: Iterable[Tuple[str, str]]) -> None:
+        by_month: Dict[str, List[Tuple[str, str]]] = {}
+        for date_str, section_name in keys:
+            by_month.setdefault(date_str[:7], []).append((date_str, section_name))
+
+        with self._lock:
+            for month, month_keys in by_month.items():
+                shard = self._load_shard(month)
+                for date_str, section_name in month_keys:
+                    legacy_record = (
+                        self.legacy.load_day(date_str) if self.legacy else {}
+                    )
+                    record = shard.get(date_str, legacy_record)
+                    if section_name not in record:
+                        continue
+                    record = dict(record)
+                    del record[section_name]
+                    if record or legacy_record:
+                        # An empty record still hides the day in the legacy file
+                        shard[date_str] = record
+                    else:
+                        del shard[date_str]
+                self._write_shard(month, shard)
+
+    def data_signature(self):
+        with self._lock:
+            shards = {
+                month: file_signature(self.shard_path(month))
+                for month in self._stored_months()
+            }
+        legacy = self.legacy.data_signature() if self.legacy is not None else None
+        return {"shards": shards, "legacy": legacy}
+
+    def iter_days(self) -> Iterator[Tuple[str, DayRecord]]:
+        with self._lock:
+            days: Dict[str, DayRecord] = {}
+            if self.legacy is not None:
+                days.update(self.legacy.iter_days())
+            for month in self._stored_months():
+                days.update(self._load_shard(month))
+        for date_str in sorted(days):
+            yield date_str, days[date_str]
+
+    def shard_path(self, month: str) -> str:
+        """Return the file holding a month, given as "YYYY-MM" """
+        year, month_number = month.split("-")
+        return os.path.join(self.root, year, f"{month_number}.json")
+
+    def _stored_months(self) -> List[str]:
+        months = []
+        if not os.path.isdir(self.root):
+            return months
+        for year in sorted(os.listdir(self.root)):
+            year_dir = os.path.join(self.root, year)
+            if not (year.isdigit() and os.path.isdir(year_dir)):
+                continue
+            for name in sorted(os.listdir(year_dir)):
+                stem, extension = os.path.splitext(name)
+                if extension == ".json" and stem.isdigit():
+                    months.append(f"{year}-{stem}")
+        return months
+
+    def _load_shard(self, month: str) -> Dict[str, Any]:
+        path = self.shard_path(month)
+        signature = file_signature(path)
+        cached = self._shards.get(month)
+        if cached is not None and cached[0] == signature:
+            self.cache_hits += 1
+            return cached[1]
+
+        self.cache_misses += 1
+        try:
+            with open(path, "r") as f, profiler.timer("json.parse"):
+                shard = json.load(f)
+        except FileNotFoundError:
+            shard = {}
+        self._shards[month] = (signature, shard)
+        return shard
+
+    def _write_shard(self, month: str, shard: Dict[str, Any]):
+        path = self.shard_path(month)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        temp_file = f"{path}.tmp"
+        try:
+            with open(temp_file, "w") as f, profiler.timer("json.serialize"):
+                json.dump(shard, f, indent=4)
+            os.replace(temp_file, path)
+        except OSError:
+            self._shards.pop(month, None)
+            raise
+        self._shards[month] = (file_signature(path), shard)
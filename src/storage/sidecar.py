@@ -0,0 +1,213 @@
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from src.storage.base import DayRecord
+
+SECTIONS = ("tasks", "top_tasks")
+
+# Tracker state before the first observation
+_UNSEEN = object()
+
+
+class SignatureTracker:
+    """Follow the storage signature across the app's own writes.
+
+    Writes made through ``write`` record the signature they produced, so any
+    other change of the signature means the data was changed outside the
+    app. Such changes are counted in ``external_changes``.
+    """
+
+    def __init__(self, signature: Optional[Callable[[], Any]] = None):
+        self._signature = signature
+        self._lock = threading.Lock()
+        self._seen: Any = _UNSEEN
+        self.external_changes = 0
+
+    def observe(self) -> Any:
+        """Return the current signature, noting whether it changed behind our back"""
+        with self._lock:
+            return self._observe()
+
+    def write(self, action: Callable[[], Any]) -> Any:
+        """Run a storage write and record the signature it produced"""
+        with self._lock:
+            self._observe()
+            try:
+                return action()
+            finally:
+                self._seen = self._read()
+
+    def _observe(self) -> Any:
+        signature = self._read()
+        if self._seen is not _UNSEEN and signature != self._seen:
+            self.external_changes += 1
+        self._seen = signature
+        return signature
+
+    def _read(self) -> Any:
+        if self._signature is None:
+            return None
+        # Compared with stored values, so in its JSON form (lists, not tuples)
+        return json.loads(json.dumps(self._signature()))
+
+
+class SidecarIndex(ABC):
+    """Data derived from saves, persisted to a JSON file next to the data.
+
+    ``update`` is called with every saved section. The file is written on
+    ``save`` together with the storage signature from ``tracker``; the
+    first change of a session creates an empty ``<file>.dirty`` marker
+    next to it, which ``save`` removes again. A file left dirty
+    (the app did not close cleanly), from another format version, written
+    for data that has since changed outside the app, or missing is rebuilt
+    from ``source`` on first use. A signature is only stamped if every change
+    since the index was loaded came from the app's own writes; otherwise the
+    file is left stale. Without a path the index lives in memory only.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: Optional[str],
+        source: Callable[[], Iterable[Tuple[str, DayRecord]]],
+        tracker: Optional[SignatureTracker] = None,
+    ):
+        self.path = path
+        self.marker_path = f"{path}.dirty" if path is not None else None
+        self._source = source
+        self._tracker = tracker
+        # Storage signature the indexed data corresponds to
+        self._stored_signature: Any = None
+        # tracker.external_changes when the index was loaded or rebuilt
+        self._external_changes = 0
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._dirty = False
+        self._dirty_on_disk = False
+
+    def load(self):
+        """Read the index file, or rebuild it if it cannot be trusted"""
+        with self._lock:
+            self._ensure_loaded()
+
+    def update(self, date_str: str, section_name: str, data: list):
+        """Apply a saved section"""
+        with self._lock:
+            self._ensure_loaded()
+            self._apply(date_str, section_name, data)
+            self._mark_dirty()
+
+    def rebuild(self) -> int:
+        """Recompute the index from storage, returning the number of days"""
+        with self._lock:
+            self._reset()
+            days = 0
+            source = self._source()
+            # Outside changes seen so far are part of what is read here
+            self._current_signature()
+            self._external_changes = self._tracker_changes()
+            for date_str, record in source:
+                days += 1
+                for section_name in SECTIONS:
+                    if section_name in record:
+                        self._apply(date_str, section_name, record[section_name])
+            self._loaded = True
+            self._dirty = True
+            self.save()
+            return days
+
+    def save(self):
+        """Write the index to its file if it or the storage signature changed"""
+        with self._lock:
+            if not self._loaded or self.path is None:
+                return
+            signature = self._current_signature()
+            if self._tracker_changes() != self._external_changes:
+                # Changed outside the app: keep the file stale for a rebuild
+                return
+            if not self._dirty and signature == self._stored_signature:
+                return
+            self._stored_signature = signature
+            self._write()
+            try:
+                os.remove(self.marker_path)
+            except FileNotFoundError:
+                pass
+            self._dirty = False
+            self._dirty_on_disk = False
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        state = self._read()
+        if state is None:
+            self.rebuild()
+            return
+        self._reset()
+        self._restore(state["data"])
+        self._stored_signature = state["signature"]
+        self._external_changes = self._tracker_changes()
+        self._loaded = True
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        if self.path is None or os.path.exists(self.marker_path):
+            return None
+        try:
+            with open(self.path, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("version") != self.VERSION or state.get("dirty"):
+            return None
+        if state.get("signature") != self._current_signature():
+            return None  # The data was changed outside the app
+        return state
+
+    def _write(self):
+        temp_file = f"{self.path}.tmp"
+        state = {
+            "version": self.VERSION,
+            "signature": self._stored_signature,
+            "data": self._dump(),
+        }
+        with open(temp_file, "w") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(temp_file, self.path)
+
+    def _current_signature(self) -> Any:
+        if self._tracker is None:
+            return None
+        return self._tracker.observe()
+
+    def _tracker_changes(self) -> int:
+        if self._tracker is None:
+            return 0
+        return self._tracker.external_changes
+
+    def _mark_dirty(self):
+        self._dirty = True
+        # Flag the file once per session so a crash forces a rebuild. Only a
+        # marker is written: rewriting the index here would stall the save.
+        if self.path is not None and not self._dirty_on_disk:
+            open(self.marker_path, "w").close()
+            self._dirty_on_disk = True
+
+    @abstractmethod
+    def _reset(self) -> None:
+        """Drop all indexed data"""
+
+    @abstractmethod
+    def _apply(self, date_str: str, section_name: str, data: list) -> None:
+        """Replace what is indexed for one section of one day"""
+
+    @abstractmethod
+    def _dump(self) -> Any:
+        """JSON-serializable state to persist"""
+
+    @abstractmethod
+    def _restore(self, data: Any) -> None:
+        """Load state written by _dump"""
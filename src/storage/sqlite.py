@@ -0,0 +1,139 @@
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from src.storage.base import DayRecord, StorageBackend
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS top_tasks (
+    date TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (date, position)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS tasks (
+    date TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL NOT NULL,
+    PRIMARY KEY (date, position)
+) WITHOUT ROWID;
+
+-- Bumped by every row change, including changes made by other programs
+CREATE TABLE IF NOT EXISTS data_version (version INTEGER NOT NULL);
+INSERT INTO data_version SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM data_version);
+"""
+
+VERSION_TRIGGERS = "".join(
+    f"CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()} AFTER {event} ON {table} "
+    "BEGIN UPDATE data_version SET version = version + 1; END;\n"
+    for table in ("top_tasks", "tasks")
+    for event in ("INSERT", "UPDATE", "DELETE")
+)
+
+
+class SqliteStorage(StorageBackend):
+    """SQLite database with one table per section, keyed by date.
+
+    Loading or saving a day only touches that date's rows through the primary
+    key index, independent of how much history the database holds.
+    """
+
+    # Column order of each section table after the (date, position) key
+    COLUMNS = {
+        "top_tasks": ("text", "completed"),
+        "tasks": ("name", "start_time", "end_time"),
+    }
+
+    def __init__(self, path="tasks.db"):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.executescript(VERSION_TRIGGERS)
+
+    def load_day(self, date_str: str) -> DayRecord:
+        self.cache_misses += 1
+        record = {}
+        with self._lock:
+            for section_name in self.COLUMNS:
+                rows = self._conn.execute(
+                    f"SELECT {self._column_list(section_name)} FROM {section_name} "
+                    "WHERE date = ? ORDER BY position",
+                    (date_str,),
+                ).fetchall()
+                if rows:
+                    record[section_name] = [
+                        self._row_to_item(section_name, row) for row in rows
+                    ]
+        return record
+
+    def save_section(
+        self, date_str: str, section_name: str, data: List[Dict[str, Any]]
+    ) -> None:
+        with self._lock, self._conn:
+            self._write_section(date_str, section_name, data)
+
+    def save_days(self, days: Iterator[Tuple[str, DayRecord]]) -> None:
+        """Write many days in a single transaction"""
+        with self._lock, self._conn:
+            for date_str, record in days:
+                for section_name, data in record.items():
+                    if section_name in self.COLUMNS:
+                        self._write_section(date_str, section_name, data)
+
+    def delete_sections(self, keys: Iterable[Tuple[str, str]]) -> None:
+        with self._lock, self._conn:
+            for date_str, section_name in keys:
+                if section_name in self.COLUMNS:
+                    self._write_section(date_str, section_name, [])
+
+    def iter_days(self) -> Iterator[Tuple[str, DayRecord]]:
+        days: Dict[str, DayRecord] = {}
+        with self._lock:
+            for section_name in self.COLUMNS:
+                rows = self._conn.execute(
+                    f"SELECT date, {self._column_list(section_name)} "
+                    f"FROM {section_name} ORDER BY date, position"
+                ).fetchall()
+                for row in rows:
+                    days.setdefault(row[0], {}).setdefault(section_name, []).append(
+                        self._row_to_item(section_name, row[1:])
+                    )
+        for date_str in sorted(days):
+            yield date_str, days[date_str]
+
+    def data_signature(self):
+        with self._lock:
+            return self._conn.execute("SELECT version FROM data_version").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _write_section(self, date_str, section_name, data):
+        columns = self.COLUMNS[section_name]
+        self._conn.execute(f"DELETE FROM {section_name} WHERE date = ?", (date_str,))
+        self._conn.executemany(
+            f"INSERT INTO {section_name} (date, position, {', '.join(columns)}) "
+            f"VALUES (?, ?, {', '.join('?' for _ in columns)})",
+            [
+                (date_str, position, *(item[column] for column in columns))
+                for position, item in enumerate(data)
+            ],
+        )
+
+    def _column_list(self, section_name):
+        return ", ".join(self.COLUMNS[section_name])
+
+    def _row_to_item(self, section_name, row):
+        item = dict(zip(self.COLUMNS[section_name], row))
+        if section_name == "top_tasks":
+            item["completed"] = bool(item["completed"])
+        return item
@@ -0,0 +1,163 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.storage.base import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+SectionKey = Tuple[str, str]
+# Section data to save, or None to delete the section
+SectionData = Optional[List[Dict[str, Any]]]
+
+
+def write_sections(storage: StorageBackend, sections: Dict[SectionKey, SectionData]):
+    """Save and delete sections with one storage call each"""
+    days: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    deleted = []
+    for (date_str, section_name), data in sections.items():
+        if data is None:
+            deleted.append((date_str, section_name))
+        else:
+            days.setdefault(date_str, {})[section_name] = data
+    if days:
+        storage.save_days(iter(days.items()))
+    if deleted:
+        storage.delete_sections(deleted)
+
+
+class WriteBehindQueue:
+    """Coalesce section saves and write them from a background thread.
+
+    Saves to the same (date, section) within ``delay`` seconds of each other
+    collapse into one write of the latest data, and everything due at the
+    same time goes to the backend in one ``save_days`` call. Pending data stays readable
+    through ``get`` until it has reached the storage backend. Queued deletes
+    go through the same path as saves of None. Writes are run
+    through ``writer``, if given, which calls the write it is passed.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        delay=0.5,
+        writer: Optional[Callable[[Callable[[], Any]], Any]] = None,
+    ):
+        self.storage = storage
+        self.delay = delay
+        self._writer = writer or (lambda write: write())
+
+        self._pending: Dict[SectionKey, Tuple[float, SectionData]] = {}
+        self._in_flight: Dict[SectionKey, SectionData] = {}
+        self._condition = threading.Condition()
+        # Held while writing so flush() and the worker never reorder saves
+        self._write_lock = threading.Lock()
+        self._closed = False
+
+        self.saves_queued = 0
+        self.writes = 0
+
+        self._worker = threading.Thread(
+            target=self._run, name="write-behind", daemon=True
+        )
+        self._worker.start()
+
+    def put(self, date_str: str, section_name: str, data: List[Dict[str, Any]]):
+        """Queue a section save, replacing any pending save of the same section"""
+        self.put_many({(date_str, section_name): data})
+
+    def put_many(self, sections: Dict[SectionKey, SectionData]):
+        """Queue several section saves, or deletes for None, written together"""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Write-behind queue is closed")
+            # A shared deadline keeps the sections in the same write
+            deadline = time.monotonic() + self.delay
+            for key, data in sections.items():
+                self._pending.pop(key, None)
+                self._pending[key] = (deadline, data)
+            self.saves_queued += len(sections)
+            self._condition.notify()
+
+    def get(self, date_str: str, section_name: str) -> Optional[List[Dict[str, Any]]]:
+        """Return data not yet written for a section, or None"""
+        key = (date_str, section_name)
+        with self._condition:
+            if key in self._pending:
+                data = self._pending[key][1]
+            elif key in self._in_flight:
+                data = self._in_flight[key]
+            else:
+                return None
+        # A section waiting to be deleted reads as empty
+        return [] if data is None else data
+
+    def flush(self):
+        """Write all pending saves now, on the calling thread"""
+        with self._write_lock:
+            with self._condition:
+                due = self._take(lambda deadline: True)
+            self._write(due)
+
+    def close(self):
+        """Stop the worker and write whatever is still pending"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._worker.join()
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._pending:
+                        next_deadline = min(d for d, _ in self._pending.values())
+                        timeout = next_deadline - time.monotonic()
+                        if timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+
+            with self._write_lock:
+                now = time.monotonic()
+                with self._condition:
+                    due = self._take(lambda deadline: deadline <= now)
+                self._write(due)
+
+    def _take(self, is_due) -> Dict[SectionKey, SectionData]:
+        """Move due entries from pending to in-flight, caller holds the condition"""
+        due = {
+            key: data
+            for key, (deadline, data) in self._pending.items()
+            if is_due(deadline)
+        }
+        for key in due:
+            del self._pending[key]
+        self._in_flight.update(due)
+        return due
+
+    def _write(self, due: Dict[SectionKey, SectionData]):
+        """Write due sections with a single storage call"""
+        if not due:
+            return
+        try:
+            self._writer(lambda: write_sections(self.storage, due))
+            self.writes += 1
+        except Exception:
+            dates = sorted({date_str for date_str, _ in due})
+            logger.exception("Saving %s failed", ", ".join(dates))
+            # Keep the data around for the next attempt unless superseded
+            with self._condition:
+                for key, data in due.items():
+                    self._pending.setdefault(key, (time.monotonic() + self.delay, data))
+        finally:
+            with self._condition:
+                for key in due:
+                    self._in_flight.pop(key, None)
@@ -1,10 +1,14 @@
+import threading
 import tkinter as tk
 from datetime import datetime
 
-from src.models.data_classes import Colors, Dimensions
+from src.data_manager import DataManager
+from src.day_cache import DayModelCache
+from src.models.data_classes import Colors, Dimensions, UIConfig
 from src.sections.date_navigation import DateNavigationBar
 from src.sections.time_blocks import TimeBlocksSection
 from src.sections.top_tasks import TopTasksSection
+from src.utils.profiling import profiled, profiler
 
 
 class TimeManagementApp:
@@ -36,31 +40,70 @@ class TimeManagementApp:
 
         self.current_date = datetime.now().date()
 
+        # Single store shared by all sections so background saves have one writer
+        self.data_manager = DataManager()
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Parsed days around the current date, prefetched in the background
+        config = UIConfig()
+        self.day_cache = DayModelCache(
+            self.data_manager,
+            radius=config.PREFETCH_DAYS,
+            max_entries=config.DAY_CACHE_SIZE,
+        )
+
         # Initialize sections
         self.date_navigation = DateNavigationBar(
             parent=self.window,
             initial_date=self.current_date,
             on_date_change=self.handle_date_change,
+            data_manager=self.data_manager,
         )
         self.date_navigation.grid(row=0, column=0, sticky="ew")
 
         self.top_tasks = TopTasksSection(
-            parent=self.window, current_date=self.current_date
+            parent=self.window,
+            current_date=self.current_date,
+            data_manager=self.data_manager,
         )
         self.top_tasks.grid(row=1, column=0, sticky="ew")
 
         self.time_blocks = TimeBlocksSection(
-            parent=self.window, current_date=self.current_date
+            parent=self.window,
+            current_date=self.current_date,
+            data_manager=self.data_manager,
         )
         self.time_blocks.grid(
             row=2, column=0, sticky="nsew"
         )  # Changed from row=2 to match configuration
 
+        self.day_cache.prefetch_around(self.current_date)
+
+        # Stats rollups and the search index are read (or rebuilt) off the
+        # Tk thread so the first save or search does not wait for them
+        threading.Thread(
+            target=self.data_manager.load_indexes, name="load-indexes", daemon=True
+        ).start()
+
+        # Ctrl+Shift+P dumps timings when profiling is enabled
+        profiler.install(self.window)
+
+    @profiled("app.handle_date_change")
     def handle_date_change(self, new_date):
         """Handle date changes and update all sections"""
         self.current_date = new_date
-        self.top_tasks.load_tasks(new_date)
-        self.time_blocks.load_blocks(new_date)
+        model = self.day_cache.get(new_date)
+        self.top_tasks.load_tasks(new_date, model.copy_top_tasks())
+        self.time_blocks.load_blocks(new_date, model)
+        self.day_cache.prefetch_around(new_date)
+
+    def _on_close(self):
+        """Write pending saves before the window goes away"""
+        self.day_cache.close()
+        self.data_manager.close()
+        if profiler.enabled:
+            profiler.dump()
+        self.window.destroy()
 
     def run(self):
         self.window.mainloop()
@@ -0,0 +1,163 @@
+import bisect
+import cProfile
+import functools
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# Upper bounds of the histogram buckets, in milliseconds
+BUCKET_BOUNDS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000]
+
+ENV_VAR = "TIME_TRACKER_PROFILE"
+
+
+class Histogram:
+    """Timing samples of one metric: fixed buckets plus a rolling window"""
+
+    def __init__(self, window=1024):
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.recent: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float):
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self.recent.append(elapsed_ms)
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Percentile over the rolling window"""
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in BUCKET_BOUNDS_MS] + ["slower"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p90_ms": self.percentile(0.9),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class Profiler:
+    """Opt-in timing of hot paths.
+
+    Turned on with the TIME_TRACKER_PROFILE environment variable or the
+    ``--profile`` command line flag. When off, instrumented code only pays
+    for one attribute check per call.
+    """
+
+    def __init__(self):
+        self.enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+        self.pstats_path = "time_tracker.pstats"
+        self.histograms: Dict[str, Histogram] = {}
+        # name -> callable returning counters to print with the timings
+        self.counters: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    def enable(self, pstats_path: Optional[str] = None):
+        self.enabled = True
+        if pstats_path:
+            self.pstats_path = pstats_path
+
+    def record(self, name: str, elapsed_ms: float):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.record(elapsed_ms)
+
+    def add_counters(self, name: str, source: Callable[[], Dict[str, Any]]):
+        """Print the counters returned by source under ``name`` in dumps"""
+        with self._lock:
+            self.counters[name] = source
+
+    @contextmanager
+    def timer(self, name: str):
+        """Time the body of a with block under ``name``"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def install(self, window):
+        """Start a cProfile session and bind Ctrl+Shift+P to dump results"""
+        if not self.enabled:
+            return
+        if self._cprofile is None:
+            # cProfile only sees the thread it was enabled on, the Tk thread
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        window.bind("<Control-P>", lambda e: self.dump())
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                name: histogram.summary()
+                for name, histogram in sorted(self.histograms.items())
+            }
+
+    def dump(self, stream=None):
+        """Print timing summaries and write the cProfile stats file"""
+        stream = stream or sys.stderr
+        lines: List[str] = [
+            f"{'metric':40} {'count':>7} {'mean':>9} {'p50':>9} {'p99':>9} {'max':>9}"
+        ]
+        for name, stats in self.summary().items():
+            lines.append(
+                f"{name:40} {stats['count']:>7} {stats['mean_ms']:>9.3f} "
+                f"{stats['p50_ms']:>9.3f} {stats['p99_ms']:>9.3f} "
+                f"{stats['max_ms']:>9.3f}"
+            )
+        with self._lock:
+            counters = sorted(self.counters.items())
+        for name, source in counters:
+            values = " ".join(
+                f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in source().items()
+            )
+            lines.append(f"{name:40} {values}")
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(self.pstats_path)
+            lines.append(f"cProfile stats written to {self.pstats_path}")
+        print("\n".join(lines), file=stream, flush=True)
+
+
+profiler = Profiler()
+
+
+def profiled(name: str):
+    """Decorator recording the duration of each call when profiling is on"""
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.record(name, (time.perf_counter() - start) * 1000)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from tkinter import font as tkfont
+from typing import Dict, Optional, Tuple
+
+from src.utils.profiling import profiler
+
+FontSpec = Tuple
+
+
+class TextLayout:
+    """Measure and truncate text in pixels, with an LRU cache of results.
+
+    Fonts are passed as the same tuples used for widget ``font=`` options,
+    e.g. ``("Arial", 10, "bold")``. Needs a Tk root to exist.
+    """
+
+    _shared: Optional["TextLayout"] = None
+
+    def __init__(self, max_entries=4096, ellipsis="..."):
+        self.max_entries = max_entries
+        self.ellipsis = ellipsis
+        self._fonts: Dict[FontSpec, tkfont.Font] = {}
+        self._cache: "OrderedDict[Tuple[FontSpec, str, int], str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> "TextLayout":
+        """Return the application-wide instance"""
+        if cls._shared is None:
+            cls._shared = cls()
+            profiler.add_counters("text_layout", cls._shared.stats)
+        return cls._shared
+
+    def font(self, font_spec: FontSpec) -> tkfont.Font:
+        font = self._fonts.get(font_spec)
+        if font is None:
+            font = tkfont.Font(font=font_spec)
+            self._fonts[font_spec] = font
+        return font
+
+    def measure(self, font_spec: FontSpec, text: str) -> int:
+        """Return the width of text in pixels"""
+        return self.font(font_spec).measure(text)
+
+    def truncate(self, font_spec: FontSpec, text: str, width: int) -> str:
+        """Return text, shortened with an ellipsis if it is wider than width"""
+        key = (font_spec, text, width)
+        result = self._cache.get(key)
+        if result is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = self._truncate(self.font(font_spec), text, width)
+        self._cache[key] = result
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return result
+
+    def stats(self) -> Dict[str, float]:
+        """Return cache counters for profiling"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._cache),
+        }
+
+    def _truncate(self, font: tkfont.Font, text: str, width: int) -> str:
+        if font.measure(text) <= width:
+            return text
+
+        # Binary search for the longest prefix that still fits with the ellipsis
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if font.measure(text[:middle] + self.ellipsis) <= width:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low].rstrip() + self.ellipsis
@@ -1,145 +1,204 @@
+import sys
 import tkinter as tk
 
+from src.utils.text_layout import TextLayout
+
 class TooltipManager:
+    """
+    Shows tooltips in one window per application.
+
+    The window is created on first use, then moved, resized and given new text
+    for every tooltip instead of being rebuilt. Tooltips appear after SHOW_DELAY
+    milliseconds, so a pointer just passing over a widget costs nothing.
+    """
+
+    # Milliseconds the pointer has to rest on a widget before its tooltip shows
+    SHOW_DELAY = 400
+    BACKGROUND = '#F0F0F0'
+    RADIUS = 8
+    MAX_CACHED_SIZES = 512
+
+    _window = None
+    _canvas = None
+    _shape_id = None
+    _text_id = None
+    # Whether the window corners can be made transparent for rounded corners
+    _transparent = False
+    # Widget the tooltip is shown or scheduled for, and the pending after() id
+    _owner = None
+    _pending = None
+    # (text, font) -> (width, height) of the rendered text
+    _sizes = {}
+
     @staticmethod
-    def setup_tooltip(label_or_canvas, full_text, font_family="Arial", font_size=11, parent=None, is_canvas=False, x=None, y=None, item_ids=None):
+    def show_tooltip(widget, full_text, font_family="Arial", font_size=11, item_id=None, delay=None):
         """
-        Set up tooltip for either a label or canvas text
-        
-        Parameters:
-        - label_or_canvas: tk.Label or tk.Canvas widget
-        - full_text: Text to show in tooltip
-        - font_family: Font family to use
-        - font_size: Font size to use
-        - parent: Parent window (needed for canvas tooltips)
-        - is_canvas: Whether this is for a canvas text
-        - item_ids: List of canvas item IDs that should trigger the tooltip (for canvas only)
+        Show a tooltip below a widget, or below a canvas item if item_id is given,
+        once the pointer has rested for delay milliseconds (SHOW_DELAY by default)
         """
-        widget = label_or_canvas
-        
-        # First clean up any existing tooltip
-        if hasattr(widget, 'tooltip') and widget.tooltip is not None:
+        TooltipManager.hide_tooltip()
+        if delay is None:
+            delay = TooltipManager.SHOW_DELAY
+
+        TooltipManager._owner = widget
+        font = (font_family, font_size)
+        if delay > 0:
+            TooltipManager._pending = widget.after(
+                delay, lambda: TooltipManager._display(widget, full_text, font, item_id)
+            )
+        else:
+            TooltipManager._display(widget, full_text, font, item_id)
+
+    @staticmethod
+    def hide_tooltip(widget=None):
+        """Hide the tooltip shown or scheduled for a widget, or any tooltip if None"""
+        owner = TooltipManager._owner
+        if owner is None or (widget is not None and widget is not owner):
+            return
+        TooltipManager._owner = None
+
+        if TooltipManager._pending is not None:
             try:
-                widget.tooltip.destroy()
-                widget.tooltip = None
+                owner.after_cancel(TooltipManager._pending)
             except tk.TclError:
                 pass
-        
-        # Remove existing bindings
-        if is_canvas and item_ids:
-            for item_id in item_ids:
-                for bind_tag in widget.tag_bind(item_id):
-                    if str(bind_tag).startswith('tooltip'):
-                        widget.tag_unbind(item_id, bind_tag)
-        else:
-            widget.unbind('<Enter>')
-            widget.unbind('<Leave>')
-        
-        widget.tooltip = None
-        
-        def create_tooltip(event):
-            destroy_tooltip()
-
-            tooltip = tk.Toplevel(parent if is_canvas else widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.attributes('-transparentcolor', '#F0F0F0')
-            
-            # Calculate text dimensions
-            temp_label = tk.Label(tooltip, text=full_text, font=(font_family, font_size))
-            text_width = temp_label.winfo_reqwidth()
-            text_height = temp_label.winfo_reqheight()
-            temp_label.destroy()
-            
-            canvas_width = text_width + 40
-            canvas_height = text_height + 16
-            
-            canvas = tk.Canvas(
-                tooltip,
-                width=canvas_width,
-                height=canvas_height,
-                bg='#F0F0F0',
-                highlightthickness=0
-            )
-            canvas.pack()
-
-            # Define coordinates for rounded rectangle
-            radius = 8
-            x1, y1 = 1, 1
-            x2 = canvas_width - 1
-            y2 = canvas_height - 1
-            
-            # Create rounded rectangle
-            canvas.create_polygon(
-                x1+radius, y1,
-                x2-radius, y1,
-                x2, y1,
-                x2, y1+radius,
-                x2, y2-radius,
-                x2, y2,
-                x2-radius, y2,
-                x1+radius, y2,
-                x1, y2,
-                x1, y2-radius,
-                x1, y1+radius,
-                x1, y1,
-                smooth=True,
-                fill="white",
-                outline="#38352A"
-            )
-            
-            canvas.create_text(
-                canvas_width/2,
-                canvas_height/2,
-                text=full_text,
-                font=(font_family, font_size),
-                fill="#38352A",
-                anchor="center",
-                width=canvas_width-20
-            )
+            TooltipManager._pending = None
 
-            widget.tooltip = tooltip
-
-            # Position tooltip based on widget type
-            if is_canvas and item_ids:
-                # For time block tasks
-                text_bbox = widget.bbox(item_ids[1])  # Use text item ID for positioning
-                if not text_bbox:
-                    return
-                
-                # Calculate position relative to the text
-                tooltip_x = widget.winfo_rootx() + text_bbox[0] + (text_bbox[2] - text_bbox[0]) // 2 - canvas_width // 2
-                tooltip_y = widget.winfo_rooty() + text_bbox[3] + 5
-            else:
-                # For top tasks (preserve original behavior)
-                tooltip_x = widget.winfo_rootx()
-                tooltip_y = widget.winfo_rooty() + widget.winfo_height() + 5
-            
-            # Ensure tooltip stays within screen bounds
-            screen_width = tooltip.winfo_screenwidth()
-            if tooltip_x + canvas_width > screen_width:
-                tooltip_x = screen_width - canvas_width - 10
-            if tooltip_x < 0:
-                tooltip_x = 10
-            
-            tooltip.wm_geometry(f"+{tooltip_x}+{tooltip_y}")
-            tooltip.wm_attributes("-topmost", True)
-
-        def destroy_tooltip():
-            if hasattr(widget, 'tooltip') and widget.tooltip is not None:
-                try:
-                    widget.tooltip.destroy()
-                    widget.tooltip = None
-                except tk.TclError:
-                    pass
-
-        # Add new bindings
-        if is_canvas and item_ids:
-            # For time block tasks
-            for item_id in item_ids:
-                widget.tag_bind(item_id, '<Enter>', create_tooltip, add='+')
-                widget.tag_bind(item_id, '<Leave>', lambda e: destroy_tooltip(), add='+')
+        if TooltipManager._window is not None:
+            try:
+                TooltipManager._window.withdraw()
+            except tk.TclError:
+                pass
+
+    @staticmethod
+    def _display(widget, full_text, font, item_id):
+        TooltipManager._pending = None
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        if item_id is not None:
+            # For time block tasks, positioned below the text item
+            text_bbox = widget.bbox(item_id)
+            if not text_bbox:
+                return
+
+        window, canvas = TooltipManager._ensure_window(widget)
+        text_width, text_height = TooltipManager._measure(full_text, font)
+        canvas_width = text_width + 40
+        canvas_height = text_height + 16
+
+        canvas.configure(width=canvas_width, height=canvas_height)
+        canvas.coords(TooltipManager._shape_id, *TooltipManager._outline(canvas_width, canvas_height))
+        canvas.coords(TooltipManager._text_id, canvas_width / 2, canvas_height / 2)
+        canvas.itemconfigure(
+            TooltipManager._text_id, text=full_text, font=font, width=canvas_width - 20
+        )
+
+        # Position tooltip based on widget type
+        if item_id is not None:
+            # Calculate position relative to the text
+            tooltip_x = widget.winfo_rootx() + text_bbox[0] + (text_bbox[2] - text_bbox[0]) // 2 - canvas_width // 2
+            tooltip_y = widget.winfo_rooty() + text_bbox[3] + 5
         else:
             # For top tasks (preserve original behavior)
-            if len(full_text) > 29:  # Only add bindings for labels if text is too long
-                widget.bind('<Enter>', create_tooltip, add='+')
-                widget.bind('<Leave>', lambda e: destroy_tooltip(), add='+')
\ No newline at end of file
+            tooltip_x = widget.winfo_rootx()
+            tooltip_y = widget.winfo_rooty() + widget.winfo_height() + 5
+
+        # Ensure tooltip stays within screen bounds
+        screen_width = window.winfo_screenwidth()
+        if tooltip_x + canvas_width > screen_width:
+            tooltip_x = screen_width - canvas_width - 10
+        if tooltip_x < 0:
+            tooltip_x = 10
+
+        window.wm_geometry(f"{canvas_width}x{canvas_height}+{tooltip_x}+{tooltip_y}")
+        window.deiconify()
+        window.lift()
+
+    @staticmethod
+    def _ensure_window(widget):
+        """Return the shared tooltip window and canvas, creating them if needed"""
+        window = TooltipManager._window
+        if window is not None:
+            try:
+                if window.winfo_exists():
+                    return window, TooltipManager._canvas
+            except tk.TclError:
+                pass
+
+        window = tk.Toplevel(widget.nametowidget('.'))
+        window.withdraw()
+        window.wm_overrideredirect(True)
+        window.wm_attributes("-topmost", True)
+
+        # Transparent corners are platform specific; elsewhere the box is square
+        background = TooltipManager.BACKGROUND
+        TooltipManager._transparent = False
+        try:
+            if sys.platform == 'win32':
+                window.wm_attributes('-transparentcolor', background)
+                TooltipManager._transparent = True
+            elif sys.platform == 'darwin':
+                window.wm_attributes('-transparent', True)
+                background = 'systemTransparent'
+                TooltipManager._transparent = True
+        except tk.TclError:
+            background = TooltipManager.BACKGROUND
+
+        canvas = tk.Canvas(window, bg=background, highlightthickness=0)
+        canvas.pack()
+        TooltipManager._shape_id = canvas.create_polygon(
+            0, 0, 0, 0, 0, 0,
+            smooth=TooltipManager._transparent,
+            fill="white",
+            outline="#38352A"
+        )
+        TooltipManager._text_id = canvas.create_text(
+            0, 0,
+            fill="#38352A",
+            anchor="center"
+        )
+
+        TooltipManager._window = window
+        TooltipManager._canvas = canvas
+        return window, canvas
+
+    @staticmethod
+    def _outline(width, height):
+        """Polygon points of the tooltip box, smoothed into rounded corners"""
+        radius = TooltipManager.RADIUS if TooltipManager._transparent else 0
+        x1, y1 = 1, 1
+        x2 = width - 1
+        y2 = height - 1
+        if not radius:
+            return (x1, y1, x2, y1, x2, y2, x1, y2)
+        return (
+            x1+radius, y1,
+            x2-radius, y1,
+            x2, y1,
+            x2, y1+radius,
+            x2, y2-radius,
+            x2, y2,
+            x2-radius, y2,
+            x1+radius, y2,
+            x1, y2,
+            x1, y2-radius,
+            x1, y1+radius,
+            x1, y1,
+        )
+
+    @staticmethod
+    def _measure(text, font):
+        """Width and height of a tooltip text, cached per string and font"""
+        key = (text, font)
+        size = TooltipManager._sizes.get(key)
+        if size is None:
+            measured = TextLayout.shared().font(font)
+            size = (measured.measure(text) + 4, measured.metrics('linespace') + 4)
+            if len(TooltipManager._sizes) >= TooltipManager.MAX_CACHED_SIZES:
+                TooltipManager._sizes.clear()
+            TooltipManager._sizes[key] = size
+        return size
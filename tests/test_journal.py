@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+from src.storage.journal import JournalStorage
+
+BLOCKS = [{"name": "Deep work", "start_time": 9.0, "end_time": 10.0}]
+
+
+class JournalCrashTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "tasks.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_saves_after_a_torn_record_survive_reopening(self):
+        storage = JournalStorage(self.filename)
+        storage.save_section("2026-01-01", "tasks", BLOCKS)
+        # A save interrupted halfway leaves a line without its newline
+        with open(storage.log_filename, "a") as f:
+            f.write('{"d":"2026-01-02","s":"tasks","p":[{"na')
+
+        JournalStorage(self.filename).save_section("2026-01-03", "tasks", BLOCKS)
+        JournalStorage(self.filename).save_days(
+            iter([("2026-01-04", {"tasks": BLOCKS})])
+        )
+
+        state = JournalStorage(self.filename).load()
+        self.assertEqual(sorted(state), ["2026-01-01", "2026-01-03", "2026-01-04"])
+
+    def test_replay_skips_an_undecodable_line(self):
+        storage = JournalStorage(self.filename)
+        with open(storage.log_filename, "w") as f:
+            f.write('{"d":"2026-01-01","s":"tasks","p":[]}\n')
+            f.write("{not json\n")
+            f.write('{"d":"2026-01-03","s":"tasks","p":[]}\n')
+
+        self.assertEqual(sorted(storage.load()), ["2026-01-01", "2026-01-03"])
+
+
+if __name__ == "__main__":
+    unittest.main()